@@ -0,0 +1 @@
+"""Benchmarks with a mock Keenetic router."""
@@ -0,0 +1,292 @@
+"""Benchmark the integration against the mock Keenetic router.
+
+A config entry for the mock router is set up in a local Home Assistant
+instance the same way as from the UI, so the real KeeneticRouter (poll
+scheduler, network clients processing, top talkers, speed history, the
+device names listener) and all entity platforms are exercised.
+
+For every client count reports:
+- poll latency of one RCI batch and of separate requests per endpoint;
+- event loop time per refresh (processing of the poll results and
+  writing entity states);
+- state writes per tick (Entity.async_write_ha_state calls);
+- peak memory allocated by a batch refresh and by a legacy poll;
+- HTTP connections opened and reused.
+
+Requires Home Assistant and aiohttp to be installed. Run from the
+repository root:
+    python -m benchmarks.bench --clients 10 100 1000 5000 --ticks 10
+"""
+
+import argparse
+import asyncio
+from dataclasses import dataclass
+import json
+import logging
+import os
+from pathlib import Path
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+from aiohttp import ClientSession
+from homeassistant import bootstrap
+from homeassistant.config_entries import SOURCE_USER, ConfigEntry
+from homeassistant.const import (
+    CONF_HOST,
+    CONF_NAME,
+    CONF_PASSWORD,
+    CONF_PORT,
+    CONF_USERNAME,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
+
+from custom_components.ha_keenetic_rest.api import (
+    RCI_CLIENTS_SUMMARY,
+    RCI_INTERFACE_STATS,
+    RCI_INTERNET_STATUS,
+    RCI_NETWORK_CLIENTS,
+    RCI_SYSTEM_STATS,
+    KeeneticAPI,
+    RCICommand,
+)
+from custom_components.ha_keenetic_rest.const import (
+    DOMAIN,
+    UPDATE_COORDINATOR_CLIENTS,
+    UPDATE_COORDINATOR_IF_STATS,
+    UPDATE_COORDINATOR_INTERNET_STATUS,
+    UPDATE_COORDINATOR_SYS_STATS,
+)
+from custom_components.ha_keenetic_rest.router import KeeneticRouter
+
+from .mock_router import WAN_INTERFACE, MockKeeneticRouter
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_CLIENTS = (10, 100, 1000, 5000)
+POLL_INTERVAL = 30
+CUSTOM_COMPONENTS = Path(__file__).parent.parent / "custom_components"
+
+# Topics polled every tick with the default intervals
+POLL_TOPICS = (
+    UPDATE_COORDINATOR_SYS_STATS,
+    UPDATE_COORDINATOR_INTERNET_STATUS,
+    UPDATE_COORDINATOR_CLIENTS,
+    UPDATE_COORDINATOR_IF_STATS,
+)
+
+# Requests made every tick before batching and local rates
+LEGACY_POLL_COMMANDS = (
+    RCICommand(RCI_SYSTEM_STATS),
+    RCICommand(RCI_INTERNET_STATUS),
+    RCICommand(RCI_NETWORK_CLIENTS),
+    RCICommand(RCI_INTERFACE_STATS, {"name": WAN_INTERFACE}),
+    RCICommand(RCI_CLIENTS_SUMMARY, {"attribute": "rxspeed", "detail": 0}),
+    RCICommand(RCI_CLIENTS_SUMMARY, {"attribute": "txspeed", "detail": 0}),
+)
+
+
+@dataclass
+class BenchmarkResult:
+    """Results for one client count."""
+    clients: int
+    entities: int
+    batch_latency: list[float]
+    legacy_latency: list[float]
+    refresh_time: list[float]
+    state_writes: list[int]
+    peak_memory: int
+    legacy_peak_memory: int
+    connections_opened: int = 0
+    connections_reused: int = 0
+
+
+class StateWriteCounter:
+    """Count Entity.async_write_ha_state calls of all entities."""
+
+    def __init__(self) -> None:  # noqa: D107
+        self.count = 0
+        self._original = Entity.async_write_ha_state
+
+
+    def __enter__(self) -> "StateWriteCounter":  # noqa: D105
+        original = self._original
+
+        def async_write_ha_state(entity: Entity) -> None:
+            self.count += 1
+            original(entity)
+
+        Entity.async_write_ha_state = async_write_ha_state
+        return self
+
+
+    def __exit__(self, *_args) -> None:  # noqa: D105
+        Entity.async_write_ha_state = self._original
+
+
+async def _async_setup_hass(config_dir: str) -> HomeAssistant:
+    """Start Home Assistant with the integration as a custom component."""
+    os.symlink(CUSTOM_COMPONENTS, Path(config_dir) / "custom_components")
+
+    hass = HomeAssistant(config_dir)
+    hass.config.skip_pip = True
+    await bootstrap.async_from_config_dict({}, hass)
+    await hass.async_start()
+    return hass
+
+
+async def _async_add_entry(hass: HomeAssistant, router: MockKeeneticRouter,
+                           port: int) -> ConfigEntry:
+    """Add config entry of the mock router with the user config flow."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={"source": SOURCE_USER},
+        data={
+            CONF_NAME: "Benchmark",
+            CONF_HOST: "127.0.0.1",
+            CONF_PORT: port,
+            CONF_USERNAME: router.username,
+            CONF_PASSWORD: router.password,
+        }
+    )
+    entry: ConfigEntry = result["result"]
+    # Deferred topics refresh
+    await hass.async_block_till_done(wait_background_tasks=True)
+    return entry
+
+
+async def _legacy_poll(session: ClientSession) -> None:
+    """Poll with separate GET requests decoded as before batching."""
+    async def _get(command: RCICommand) -> None:
+        async with session.get(command.url, params=command.params) as resp:
+            resp.raise_for_status()
+            json.loads(await resp.read())
+
+    await asyncio.gather(*(_get(command) for command in LEGACY_POLL_COMMANDS))
+
+
+async def _benchmark(hass: HomeAssistant, counter: StateWriteCounter,
+                     clients: int, ticks: int) -> BenchmarkResult:
+    mock = MockKeeneticRouter(clients=clients)
+    port = await mock.start()
+
+    entry = await _async_add_entry(hass, mock, port)
+    router: KeeneticRouter = hass.data[DOMAIN][entry.entry_id]
+    # Polls are made by ticks only
+    router.scheduler.stop()
+
+    # Legacy polls have their own session, not sharing the router cache
+    legacy_api = KeeneticAPI(scheme="http", host="127.0.0.1", port=str(port),
+                             ssl_validation=False)
+
+    result = BenchmarkResult(
+        clients=clients,
+        entities=sum(
+            not entity.disabled
+            for entity in er.async_entries_for_config_entry(
+                er.async_get(hass), entry.entry_id)
+        ),
+        batch_latency=[], legacy_latency=[], refresh_time=[],
+        state_writes=[], peak_memory=0, legacy_peak_memory=0
+    )
+
+    try:
+        await legacy_api.auth(mock.username, mock.password)
+        legacy_session = legacy_api._session  # noqa: SLF001
+
+        for _ in range(ticks):
+            mock.advance(POLL_INTERVAL)
+            # Cached results expire long before the next real poll
+            router.api.clear_cache()
+
+            # Memory of every path is traced separately
+            tracemalloc.start()
+            started = time.perf_counter()
+            await _legacy_poll(legacy_session)
+            result.legacy_latency.append(time.perf_counter() - started)
+            result.legacy_peak_memory = max(result.legacy_peak_memory,
+                                            tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+
+            tracemalloc.start()
+            counter.count = 0
+            started = time.perf_counter()
+            await router.scheduler.async_refresh(list(POLL_TOPICS))
+            await hass.async_block_till_done()
+            elapsed = time.perf_counter() - started
+            result.peak_memory = max(result.peak_memory,
+                                     tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+
+            result.batch_latency.append(router.last_poll_latency)
+            result.refresh_time.append(elapsed - router.last_poll_latency)
+            result.state_writes.append(counter.count)
+
+        result.connections_opened = router.api.pool_stats.connections_opened
+        result.connections_reused = router.api.pool_stats.connections_reused
+    finally:
+        tracemalloc.stop()
+        await legacy_api.close()
+        await hass.config_entries.async_remove(entry.entry_id)
+        await mock.stop()
+
+    return result
+
+
+def _format_ms(values: list[float]) -> str:
+    return f"{statistics.median(values) * 1000:8.1f} / " \
+           f"{max(values) * 1000:8.1f}"
+
+
+def _print_results(results: list[BenchmarkResult]) -> None:
+    header = (
+        f"{'clients':>8} {'entities':>9} "
+        f"{'batch poll, ms':>19} {'legacy poll, ms':>19} "
+        f"{'refresh, ms':>19} {'writes/tick':>12} {'peak MiB':>15} "
+        f"{'conn new/reused':>16}"
+    )
+    print(header)  # noqa: T201
+    print(f"{'':>19}{'median / max':>19}{'median / max':>20}"  # noqa: T201
+          f"{'median / max':>20}{'median':>13}{'batch / legacy':>16}")
+    for result in results:
+        writes = statistics.median(result.state_writes)
+        print(  # noqa: T201
+            f"{result.clients:>8} {result.entities:>9} "
+            f"{_format_ms(result.batch_latency):>19} "
+            f"{_format_ms(result.legacy_latency):>19} "
+            f"{_format_ms(result.refresh_time):>19} "
+            f"{writes:>12.0f} {result.peak_memory / 2 ** 20:>6.1f} / "
+            f"{result.legacy_peak_memory / 2 ** 20:<6.1f} "
+            f"{result.connections_opened:>7} / {result.connections_reused:<6}"
+        )
+
+
+async def _run(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await _async_setup_hass(config_dir)
+        with StateWriteCounter() as counter:
+            results = [
+                await _benchmark(hass, counter, clients, args.ticks)
+                for clients in args.clients
+            ]
+        await hass.async_stop(force=True)
+
+    _print_results(results)
+
+
+def main() -> None:
+    """Run benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, nargs="+",
+                        default=list(DEFAULT_CLIENTS))
+    parser.add_argument("--ticks", type=int, default=10)
+    args = parser.parse_args()
+
+    asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,492 @@
+"""Local stand-in for Keenetic router RCI.
+
+Implements the "auth" challenge flow, "rci/show/*" endpoints used by the
+integration, client settings commands and batch requests to "rci/" with
+synthetic data for any number of network clients.
+
+Run standalone:
+    python -m benchmarks.mock_router --clients 1000 --port 8080
+"""
+
+import argparse
+import asyncio
+import hashlib
+import random
+import secrets
+import time
+from typing import Any
+
+from aiohttp import web
+
+SESSION_COOKIE = "mock_session"
+REALM = "Mock Keenetic"
+WAN_INTERFACE = "GigabitEthernet1"
+
+WIFI_INTERFACES = (
+    {"id": "WifiMaster0/AccessPoint0", "name": "Home", "description": "Wi-Fi 2.4 GHz"},
+    {"id": "WifiMaster1/AccessPoint0", "name": "Home", "description": "Wi-Fi 5 GHz"},
+)
+WIRED_INTERFACE = {"id": "Bridge0", "name": "Home", "description": "Home segment"}
+GUEST_INTERFACE = {"id": "Bridge1", "name": "Guest", "description": "Guest segment"}
+
+
+def _rci_error(message: str) -> dict:
+    return {"status": [{
+        "status": "error",
+        "code": "7405600",
+        "ident": "Command::Base",
+        "message": message
+    }]}
+
+
+class MockKeeneticRouter:
+    """Synthetic Keenetic router."""
+
+    def __init__(  # noqa: D107
+        self,
+        clients: int,
+        username: str = "admin",
+        password: str = "admin",
+        active_ratio: float = 0.3,
+        change_ratio: float = 0.05,
+        seed: int = 0
+    ) -> None:
+        self.username = username
+        self.password = password
+        self.change_ratio = change_ratio
+        self.requests = 0
+
+        self._random = random.Random(seed)
+        self._sessions: dict[str, dict] = {}
+        self._started = time.time()
+        self._runner: web.AppRunner | None = None
+
+        self.hosts = {
+            host["mac"]: host
+            for host in (
+                self._make_host(index, self._random.random() < active_ratio)
+                for index in range(clients)
+            )
+        }
+
+        self._handlers = {
+            ("show", "defaults"): self._show_defaults,
+            ("show", "version"): self._show_version,
+            ("show", "system"): self._show_system,
+            ("show", "internet", "status"): self._show_internet_status,
+            ("show", "interface"): self._show_interface,
+            ("show", "interface", "stat"): self._show_interface_stat,
+            ("show", "interface", "rrd"): self._show_interface_rrd,
+            ("show", "ip", "hotspot"): self._show_hotspot,
+            ("show", "ip", "hotspot", "summary"): self._show_hotspot_summary,
+            ("known", "host"): self._known_host,
+            ("ip", "hotspot", "host"): self._hotspot_host,
+        }
+        self._prefixes = {
+            path[:length]
+            for path in self._handlers
+            for length in range(1, len(path) + 1)
+        }
+
+
+    def _make_host(self, index: int, active: bool) -> dict:
+        mac = ":".join(f"{b:02x}" for b in (0x02, 0, *index.to_bytes(4, "big")))
+        wireless = index % 3 != 0
+        interface = self._random.choice(WIFI_INTERFACES) if wireless \
+            else (GUEST_INTERFACE if index % 10 == 0 else WIRED_INTERFACE)
+
+        host = {
+            "mac": mac,
+            "via": mac,
+            "ip": f"192.168.{1 + index // 250}.{2 + index % 250}",
+            "hostname": f"host-{index}" if index % 4 else "",
+            "name": f"Device {index}" if index % 2 else "",
+            "interface": dict(interface),
+            "expires": 0,
+            "registered": index % 2 == 1,
+            "access": "permit" if index % 7 else "deny",
+            "schedule": "",
+            "active": active,
+            "rxbytes": self._random.randrange(10 ** 9),
+            "txbytes": self._random.randrange(10 ** 9),
+            "uptime": self._random.randrange(10 ** 6),
+            "first-seen": self._random.randrange(10 ** 6),
+            "last-seen": 0,
+            "link": "up" if active else "down",
+            "auto-negotiation": True,
+            "speed": 1000 if not wireless else 0,
+            "duplex": True,
+            "port": str(1 + index % 4) if not wireless else "",
+        }
+        if wireless:
+            host.update({
+                "ssid": "Home",
+                "ap": interface["id"],
+                "authenticated": active,
+                "txrate": 866,
+                "ht": 80,
+                "mode": "11ac",
+                "gi": 400,
+                "rssi": -40 - self._random.randrange(40),
+                "mcs": 9,
+                "txss": 2,
+                "ebf": True,
+                "dl-mu": False,
+                "security": "wpa2-psk",
+            })
+        return host
+
+
+    def advance(self, seconds: float) -> None:
+        """Simulate network activity for the given time."""
+        for host in self.hosts.values():
+            if host["active"]:
+                host["rxbytes"] += self._random.randrange(int(seconds * 10 ** 5) + 1)
+                host["txbytes"] += self._random.randrange(int(seconds * 10 ** 4) + 1)
+                host["uptime"] += int(seconds)
+
+        changed = self._random.sample(
+            list(self.hosts.values()),
+            int(len(self.hosts) * self.change_ratio)
+        )
+        for host in changed:
+            host["active"] = not host["active"]
+            host["link"] = "up" if host["active"] else "down"
+            if "rssi" in host:
+                host["rssi"] = -40 - self._random.randrange(40)
+
+
+    # Web application
+
+    def make_app(self) -> web.Application:
+        """Make aiohttp application."""
+        app = web.Application()
+        app.router.add_get("/auth", self._handle_auth_challenge)
+        app.router.add_post("/auth", self._handle_auth_login)
+        app.router.add_post("/rci/", self._handle_batch)
+        app.router.add_get("/rci/{path:.+}", self._handle_get)
+        app.router.add_post("/rci/{path:.+}", self._handle_post)
+        return app
+
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """Start the server, return its port."""
+        self._runner = web.AppRunner(self.make_app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        return self._runner.addresses[0][1]
+
+
+    async def stop(self) -> None:
+        """Stop the server."""
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+    def _session(self, request: web.Request) -> dict | None:
+        return self._sessions.get(request.cookies.get(SESSION_COOKIE, ""))
+
+
+    async def _handle_auth_challenge(self, request: web.Request) -> web.Response:
+        session = self._session(request)
+        if session and session["authenticated"]:
+            return web.Response(status=200)
+
+        session_id = secrets.token_hex(16)
+        challenge = secrets.token_hex(16)
+        self._sessions[session_id] = {"challenge": challenge,
+                                      "authenticated": False}
+
+        response = web.Response(status=401, headers={
+            "X-NDM-Challenge": challenge,
+            "X-NDM-Realm": REALM
+        })
+        response.set_cookie(SESSION_COOKIE, session_id)
+        return response
+
+
+    async def _handle_auth_login(self, request: web.Request) -> web.Response:
+        session = self._session(request)
+        body = await request.json()
+        if session is None:
+            return web.Response(status=401)
+
+        md5 = hashlib.md5(f"{self.username}:{REALM}:{self.password}".encode())
+        sha = hashlib.sha256(f"{session['challenge']}{md5.hexdigest()}".encode())
+        if body.get("login") != self.username or \
+                body.get("password") != sha.hexdigest():
+            return web.Response(status=401)
+
+        session["authenticated"] = True
+        return web.Response(status=200)
+
+
+    def _authorized(self, request: web.Request) -> bool:
+        session = self._session(request)
+        return bool(session and session["authenticated"])
+
+
+    async def _handle_get(self, request: web.Request) -> web.Response:
+        if not self._authorized(request):
+            return web.Response(status=401)
+        self.requests += 1
+
+        path = tuple(request.match_info["path"].strip("/").split("/"))
+        params = {key: self._parse_param(value)
+                  for key, value in request.query.items()}
+        return self._make_response(path, params)
+
+
+    async def _handle_post(self, request: web.Request) -> web.Response:
+        if not self._authorized(request):
+            return web.Response(status=401)
+        self.requests += 1
+
+        path = tuple(request.match_info["path"].strip("/").split("/"))
+        return self._make_response(path, await request.json())
+
+
+    async def _handle_batch(self, request: web.Request) -> web.Response:
+        if not self._authorized(request):
+            return web.Response(status=401)
+        self.requests += 1
+
+        return web.json_response([
+            self._execute_batch_item(item) for item in await request.json()
+        ])
+
+
+    def _make_response(self, path: tuple, params: dict) -> web.Response:
+        if path not in self._handlers:
+            return web.Response(status=404)
+        result = self._handlers[path](params or {})
+        if "status" in result:
+            return web.json_response(result, status=400)
+        return web.json_response(result)
+
+
+    def _execute_batch_item(self, item: dict) -> dict:
+        """Execute {"show": {"ip": {"hotspot": {}}}} like command."""
+        path = ()
+        params: Any = item
+        while isinstance(params, dict) and len(params) == 1:
+            key = next(iter(params))
+            if (*path, key) not in self._prefixes:
+                break
+            path = (*path, key)
+            params = params[key]
+
+        handler = self._handlers.get(path)
+        result = handler(params or {}) if handler \
+            else _rci_error("no such command")
+
+        for key in reversed(path or ("unknown",)):
+            result = {key: result}
+        return result
+
+
+    @staticmethod
+    def _parse_param(value: str) -> Any:
+        return int(value) if value.isdigit() else value
+
+
+    # RCI handlers
+
+    def _show_defaults(self, _params: dict) -> dict:
+        return {"serial": "S000000000", "product": "KN-1010",
+                "ndmhwid": "KN-1010", "locale": "en"}
+
+
+    def _show_version(self, _params: dict) -> dict:
+        return {
+            "release": "4.1.7",
+            "title": "4.1.7",
+            "arch": "mips",
+            "manufacturer": "Keenetic Ltd.",
+            "vendor": "Keenetic",
+            "series": "KN",
+            "model": "Giga",
+            "hw_version": "10118000",
+            "hw_id": "KN-1010",
+            "device": "Giga",
+            "class": "Internet Center",
+            "region": "EU",
+        }
+
+
+    def _show_system(self, _params: dict) -> dict:
+        memtotal = 262144
+        memfree = memtotal // 2 + self._random.randrange(memtotal // 4)
+        return {
+            "hostname": "Keenetic_Giga",
+            "domainname": "WORKGROUP",
+            "cpuload": self._random.randrange(100),
+            "memory": f"{memtotal - memfree}/{memtotal}",
+            "swap": "0/0",
+            "memtotal": memtotal,
+            "memfree": memfree,
+            "membuffers": 4096,
+            "memcache": 40960,
+            "uptime": str(int(time.time() - self._started)),
+        }
+
+
+    def _show_internet_status(self, _params: dict) -> dict:
+        return {
+            "checked": "Mon Jan  1 00:00:00 2024",
+            "enabled": True,
+            "reliable": True,
+            "gateway-accessible": True,
+            "dns-accessible": True,
+            "captive-accessible": True,
+            "internet": True,
+            "gateway": {
+                "interface": WAN_INTERFACE,
+                "address": "10.0.0.1",
+                "failures": 0,
+                "accessible": True,
+                "excluded": False,
+            },
+            "captive": {
+                "host": "connectivitycheck.gstatic.com",
+                "response": "204",
+                "location": "",
+                "failures": 0,
+                "resolved": True,
+                "address": "142.250.0.94",
+            },
+        }
+
+
+    def _interfaces(self) -> dict:
+        interfaces = {
+            WAN_INTERFACE: {"type": "GigabitEthernet",
+                            "description": "Ethernet WAN", "role": ["inet"]},
+            "Bridge0": {"type": "Bridge", "description": "Home segment",
+                        "role": ["lan"]},
+            "Bridge1": {"type": "Bridge", "description": "Guest segment",
+                        "role": ["misc"]},
+            "WifiMaster0/AccessPoint0": {"type": "AccessPoint",
+                                         "description": "Wi-Fi 2.4 GHz"},
+            "WifiMaster1/AccessPoint0": {"type": "AccessPoint",
+                                         "description": "Wi-Fi 5 GHz"},
+            "Wireguard0": {"type": "Wireguard", "description": "VPN"},
+        }
+        return {
+            name: {"id": name, "interface-name": name, "state": "up",
+                   "link": "up", "connected": "yes", **interface}
+            for name, interface in interfaces.items()
+        }
+
+
+    def _show_interface(self, params: dict) -> dict:
+        interfaces = self._interfaces()
+        if name := params.get("name"):
+            return interfaces.get(name) or _rci_error("no such interface")
+        return interfaces
+
+
+    def _show_interface_stat(self, params: dict) -> dict:
+        if params.get("name") not in self._interfaces():
+            return _rci_error("no such interface")
+        return {
+            "rxpackets": self._random.randrange(10 ** 9),
+            "rxbytes": self._random.randrange(10 ** 12),
+            "rxerrors": 0,
+            "rxdropped": 0,
+            "txpackets": self._random.randrange(10 ** 9),
+            "txbytes": self._random.randrange(10 ** 12),
+            "txerrors": 0,
+            "txdropped": 0,
+            "rxspeed": self._random.randrange(10 ** 8),
+            "txspeed": self._random.randrange(10 ** 7),
+            "timestamp": str(int(time.time())),
+            "last-overflow": "0",
+        }
+
+
+    def _show_interface_rrd(self, params: dict) -> dict:
+        if params.get("name") not in self._interfaces():
+            return _rci_error("no such interface")
+
+        step = (3, 60, 180, 1440)[int(params.get("detail", 0)) % 4]
+        now = int(time.time())
+        return {
+            "data": [
+                {"t": now - index * step, "v": self._random.randrange(10 ** 8)}
+                for index in range(60)
+            ]
+        }
+
+
+    def _show_hotspot(self, _params: dict) -> dict:
+        return {"host": list(self.hosts.values())}
+
+
+    def _show_hotspot_summary(self, params: dict) -> dict:
+        attribute = params.get("attribute", "rxspeed")
+        return {"host": [
+            {"mac": host["mac"], "ip": host["ip"],
+             "hostname": host["hostname"], "name": host["name"],
+             "interface": host["interface"],
+             attribute: self._random.randrange(10 ** 6)}
+            for host in self.hosts.values() if host["active"]
+        ]}
+
+
+    def _known_host(self, params: dict) -> dict:
+        host = self.hosts.get(str(params.get("mac", "")).lower())
+        if host is None:
+            return _rci_error("no such host")
+        if params.get("no"):
+            host["registered"] = False
+            host["name"] = ""
+        else:
+            host["registered"] = True
+            host["name"] = params.get("name", "")
+        return {}
+
+
+    def _hotspot_host(self, params: dict) -> dict:
+        host = self.hosts.get(str(params.get("mac", "")).lower())
+        if host is None:
+            return _rci_error("no such host")
+        if "access" in params:
+            host["access"] = params["access"]
+        return {}
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    router = MockKeeneticRouter(clients=args.clients, username=args.username,
+                                password=args.password)
+    port = await router.start(args.host, args.port)
+    print(f"Mock Keenetic router with {args.clients} clients "  # noqa: T201
+          f"on http://{args.host}:{port}")
+
+    while True:
+        await asyncio.sleep(args.step)
+        router.advance(args.step)
+
+
+def main() -> None:
+    """Run mock router until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--username", default="admin")
+    parser.add_argument("--password", default="admin")
+    parser.add_argument("--step", type=float, default=30,
+                        help="simulated activity step, seconds")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Replay captured router syslog lines to the integration syslog listener.
+
+Lines are sent as separate UDP datagrams with the original delays when
+they have "%b %d %H:%M:%S" timestamps, or with a fixed delay. Lines of
+a capture file are printed with the presence parsed from them.
+
+Run from the repository root (the listener accepts messages only from
+the router address, so the router host has to be 127.0.0.1 or the
+sender address):
+    python -m benchmarks.syslog_replay capture.log --port 5514
+    python -m benchmarks.syslog_replay capture.log --parse-only
+"""
+
+import argparse
+import asyncio
+import datetime
+import re
+import socket
+import sys
+
+from custom_components.ha_keenetic_rest.syslog import parse_presence
+
+# Syslog timestamp: "Oct 17 12:00:05"
+_TIMESTAMP = re.compile(r"(?:^|>)([A-Z][a-z]{2} [ \d]\d \d\d:\d\d:\d\d)")
+
+SAMPLE_LINES = (
+    "<30>Oct 17 12:00:00 ndm: wmond: WifiMaster0/AccessPoint0: "
+    "STA(02:00:00:00:00:01) had associated.",
+    "<30>Oct 17 12:00:01 ndm: ndhcps: DHCPACK of 192.168.1.3 to "
+    "02:00:00:00:00:01.",
+    "<30>Oct 17 12:00:05 ndm: wmond: WifiMaster1/AccessPoint0: "
+    "STA(02:00:00:00:00:02) had deauthenticated by STA "
+    "(reason: STA is leaving or has left BSS).",
+)
+
+
+def _line_time(line: str) -> datetime.datetime | None:
+    if match := _TIMESTAMP.search(line):
+        return datetime.datetime.strptime(match.group(1), "%b %d %H:%M:%S")
+    return None
+
+
+async def _replay(lines: list[str], host: str, port: int,
+                  delay: float | None, speed: float) -> None:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    previous = None
+    try:
+        for line in lines:
+            current = _line_time(line)
+            if delay is not None:
+                await asyncio.sleep(delay)
+            elif previous and current and current > previous:
+                await asyncio.sleep((current - previous).total_seconds() / speed)
+            previous = current or previous
+
+            sock.sendto(line.encode(), (host, port))
+            print(f"{parse_presence(line)}\t{line}")  # noqa: T201
+    finally:
+        sock.close()
+
+
+def main() -> None:
+    """Replay syslog capture."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("capture", nargs="?",
+                        help="captured syslog lines, built-in sample if omitted")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5514)
+    parser.add_argument("--delay", type=float,
+                        help="fixed delay between lines, seconds")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="replay speed factor for original delays")
+    parser.add_argument("--parse-only", action="store_true",
+                        help="print parsed presence without sending")
+    args = parser.parse_args()
+
+    if args.capture:
+        with open(args.capture, encoding="utf-8", errors="replace") as file:
+            lines = [line.rstrip("\n") for line in file if line.strip()]
+    else:
+        lines = list(SAMPLE_LINES)
+
+    if args.parse_only:
+        for line in lines:
+            print(f"{parse_presence(line)}\t{line}")  # noqa: T201
+        sys.exit(0)
+
+    asyncio.run(_replay(lines, args.host, args.port, args.delay, args.speed))
+
+
+if __name__ == "__main__":
+    main()
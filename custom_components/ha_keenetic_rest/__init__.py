@@ -1,14 +1,44 @@
 # noqa: D104
 
 import aiohttp
+import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_NAME, Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
-from homeassistant.helpers import device_registry as dr
+from homeassistant.const import CONF_NAME, EVENT_HOMEASSISTANT_CLOSE, Platform
+from homeassistant.core import (
+    Event,
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import (
+    ConfigEntryAuthFailed,
+    ConfigEntryNotReady,
+    ServiceValidationError,
+)
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
+from .const import (
+    ATTR_ACCESS,
+    ATTR_ACTIVE,
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_CYCLES,
+    ATTR_MACS,
+    ATTR_REGISTER,
+    ATTR_REGISTERED,
+    ATTR_SEGMENT,
+    DATA_FLEET,
+    DEFAULT_PROFILE_CYCLES,
+    DOMAIN,
+    SERVICE_PROFILE_REFRESH,
+    SERVICE_SET_CLIENTS_ACCESS,
+    SERVICE_SET_CLIENTS_REGISTERED,
+    STORAGE_VERSION,
+)
+from .fleet import KeeneticFleet
 from .router import KeeneticAuthFailed, KeeneticRouter
 
 PLATFORMS: list[Platform] = [
@@ -18,6 +48,133 @@ PLATFORMS: list[Platform] = [
     Platform.SWITCH
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+PROFILE_REFRESH_SCHEMA = vol.Schema({
+    vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+    vol.Optional(ATTR_CYCLES, default=DEFAULT_PROFILE_CYCLES):
+        vol.All(vol.Coerce(int), vol.Range(min=1, max=100))
+})
+
+# Clients are given with MACs, selectors or both, at least one is required
+CLIENTS_SELECTORS = (ATTR_MACS, ATTR_REGISTERED, ATTR_ACTIVE, ATTR_SEGMENT)
+CLIENTS_SCHEMA = {
+    vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+    vol.Optional(ATTR_MACS): vol.All(cv.ensure_list, [
+        cv.matches_regex(r"^[0-9A-Fa-f]{2}(:[0-9A-Fa-f]{2}){5}$")
+    ]),
+    vol.Optional(ATTR_REGISTERED): cv.boolean,
+    vol.Optional(ATTR_ACTIVE): cv.boolean,
+    vol.Optional(ATTR_SEGMENT): cv.string
+}
+
+SET_CLIENTS_ACCESS_SCHEMA = vol.All(
+    vol.Schema({
+        **CLIENTS_SCHEMA,
+        vol.Required(ATTR_ACCESS): vol.In(("permit", "deny"))
+    }),
+    cv.has_at_least_one_key(*CLIENTS_SELECTORS)
+)
+
+SET_CLIENTS_REGISTERED_SCHEMA = vol.All(
+    vol.Schema({
+        **CLIENTS_SCHEMA,
+        vol.Required(ATTR_REGISTER): cv.boolean
+    }),
+    cv.has_at_least_one_key(*CLIENTS_SELECTORS)
+)
+
+
+def _get_router(hass: HomeAssistant, call: ServiceCall) -> KeeneticRouter:
+    """Get loaded router of the service call."""
+    router: KeeneticRouter | None = hass.data.get(DOMAIN, {}).\
+        get(call.data[ATTR_CONFIG_ENTRY_ID])
+    if router is None:
+        raise ServiceValidationError(
+            f"Keenetic router '{call.data[ATTR_CONFIG_ENTRY_ID]}' "
+            f"is not loaded"
+        )
+    return router
+
+
+def _select_clients(router: KeeneticRouter, call: ServiceCall) -> list[str]:
+    """Get Network clients of the service call."""
+    return router.select_clients(
+        macs=call.data.get(ATTR_MACS),
+        registered=call.data.get(ATTR_REGISTERED),
+        active=call.data.get(ATTR_ACTIVE),
+        segment=call.data.get(ATTR_SEGMENT)
+    )
+
+
+def _make_clients_response(
+    router: KeeneticRouter,
+    call: ServiceCall,
+    client_ids: list[str],
+    results: list
+) -> ServiceResponse:
+    """Make per-MAC results.
+
+    Given MACs of unknown clients are failed, known clients not matching
+    the selectors are not included.
+    """
+    clients = {
+        client_id: {"success": True} if result is None
+        else {"success": False, "error": str(result) or type(result).__name__}
+        for client_id, result in zip(client_ids, results, strict=True)
+    }
+    for mac in call.data.get(ATTR_MACS, []):
+        if mac.lower() not in router.client_store.clients:
+            clients[mac.lower()] = {
+                "success": False, "error": "Unknown network client"
+            }
+    return {"clients": clients}
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Create resources shared by routers and register Keenetic services."""
+    fleet = hass.data[DATA_FLEET] = KeeneticFleet()
+
+    async def async_close_fleet(_event: Event) -> None:
+        await fleet.close()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, async_close_fleet)
+
+    async def async_profile_refresh(call: ServiceCall) -> None:
+        _get_router(hass, call).start_profiling(call.data[ATTR_CYCLES])
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILE_REFRESH, async_profile_refresh,
+        schema=PROFILE_REFRESH_SCHEMA
+    )
+
+    async def async_set_clients_access(call: ServiceCall) -> ServiceResponse:
+        router = _get_router(hass, call)
+        client_ids = _select_clients(router, call)
+        results = await router.async_change_clients_access(
+            client_ids, call.data[ATTR_ACCESS] == "permit")
+        return _make_clients_response(router, call, client_ids, results)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_SET_CLIENTS_ACCESS, async_set_clients_access,
+        schema=SET_CLIENTS_ACCESS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL
+    )
+
+    async def async_set_clients_registered(call: ServiceCall) -> ServiceResponse:
+        router = _get_router(hass, call)
+        client_ids = _select_clients(router, call)
+        results = await router.async_change_clients_registered(
+            client_ids, call.data[ATTR_REGISTER])
+        return _make_clients_response(router, call, client_ids, results)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_SET_CLIENTS_REGISTERED, async_set_clients_registered,
+        schema=SET_CLIENTS_REGISTERED_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL
+    )
+    return True
+
 
 async def async_setup_entry(
     hass: HomeAssistant, config_entry: ConfigEntry
@@ -26,15 +183,20 @@ async def async_setup_entry(
 
     router = KeeneticRouter(
         hass=hass,
-        config_entry=config_entry
+        config_entry=config_entry,
+        fleet=hass.data[DATA_FLEET]
     )
     try:
         await router.async_setup()
     except (aiohttp.ClientError, TimeoutError) as ex:
         await router.close()
         raise ConfigEntryNotReady(
-            f"Failed to setup '{config_entry[CONF_NAME]}': {ex}"
+            f"Failed to setup '{config_entry.data[CONF_NAME]}': {ex}"
         ) from ex
+    except (ConfigEntryNotReady, ConfigEntryAuthFailed):
+        # First refresh failed
+        await router.close()
+        raise
     except KeeneticAuthFailed:
         await router.close()
         raise ConfigEntryAuthFailed(  # noqa: B904
@@ -46,9 +208,20 @@ async def async_setup_entry(
 
     await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
 
+    config_entry.async_on_unload(
+        config_entry.add_update_listener(async_update_options)
+    )
+
     return True
 
 
+async def async_update_options(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> None:
+    """Reload Keenetic config entry on options update."""
+    await hass.config_entries.async_reload(config_entry.entry_id)
+
+
 async def async_unload_entry(
     hass: HomeAssistant, config_entry: ConfigEntry
 ) -> bool:
@@ -65,6 +238,14 @@ async def async_unload_entry(
     return unload_ok
 
 
+async def async_remove_entry(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> None:
+    """Remove Keenetic config entry stored snapshot."""
+    await Store(hass, STORAGE_VERSION,
+                f"{DOMAIN}.{config_entry.entry_id}").async_remove()
+
+
 async def async_remove_config_entry_device(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -1,18 +1,408 @@
 """Keenetic API client."""
 
+import asyncio
+from collections import defaultdict
+from collections.abc import Callable
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass, field
 import hashlib
+import json
 import logging
+import re
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from aiohttp import (
+    BaseConnector,
+    ClientSession,
+    ClientTimeout,
+    CookieJar,
+    TCPConnector,
+    TraceConfig,
+    TraceConnectionCreateEndParams,
+    TraceConnectionQueuedEndParams,
+    TraceConnectionQueuedStartParams,
+    TraceConnectionReuseconnParams,
+)
+
+from .const import (
+    CONNECTION_CONNECT_TIMEOUT,
+    CONNECTION_KEEPALIVE_TIMEOUT,
+    CONNECTION_LIMIT_PER_HOST,
+    CONNECTION_READ_TIMEOUT,
+    CONNECTION_TIMEOUT,
+)
 
-from aiohttp import ClientSession, ClientTimeout, CookieJar
+_LOGGER = logging.getLogger(__name__)
 
-from .const import CONNECTION_TIMEOUT
+RCI_BATCH_URL = "rci/"
+RCI_ERROR_STATUSES = ("error", "critical")
 
-_LOGGER = logging.getLogger(__name__)
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Request latency histogram upper bounds, ms
+LATENCY_BUCKETS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+RCI_SYSTEM_INFO = "rci/show/defaults"
+RCI_SYSTEM_FW = "rci/show/version"
+RCI_SYSTEM_STATS = "rci/show/system"
+RCI_INTERNET_STATUS = "rci/show/internet/status"
+RCI_INTERFACES = "rci/show/interface"
+RCI_INTERFACE_STATS = "rci/show/interface/stat"
+RCI_INTERFACE_RRD = "rci/show/interface/rrd"
+RCI_NETWORK_CLIENTS = "rci/show/ip/hotspot"
+RCI_CLIENTS_SUMMARY = "rci/show/ip/hotspot/summary"
+RCI_KNOWN_HOST = "rci/known/host"
+RCI_HOTSPOT_HOST = "rci/ip/hotspot/host"
 
 # TODO:
 # - SSL Validation
 # - Bad Request in auth
 
+class KeeneticRCIError(Exception):
+    """Keenetic RCI command error."""
+
+
+@dataclass(frozen=True)
+class RCICommand:
+    """Single RCI command.
+
+    The same read command can be sent alone as GET request to its url,
+    any command can be sent as an element of a batch POST request to "rci/".
+    """
+    url: str
+    params: dict | None = None
+
+    @property
+    def path(self) -> list[str]:
+        """RCI command path, e.g. ["show", "ip", "hotspot"]."""
+        return self.url.removeprefix(RCI_BATCH_URL).split("/")
+
+    @property
+    def key(self) -> tuple[str, str | None]:
+        """Hashable (url, params) key of the command."""
+        params = json.dumps(self.params, sort_keys=True) if self.params else None
+        return (self.url, params)
+
+    @property
+    def read_only(self) -> bool:
+        """Whether the command is "show" command."""
+        return self.path[0] == "show"
+
+    def as_batch_item(self) -> dict:
+        """Make batch request element: {"show": {"system": {}}}."""
+        item = dict(self.params) if self.params else {}
+        for key in reversed(self.path):
+            item = {key: item}
+        return item
+
+    def extract_result(self, response: Any) -> Any:
+        """Extract command result from batch response element.
+
+        Returns KeeneticRCIError instance if the command failed.
+        """
+        data = response
+        for key in self.path:
+            if error := _find_rci_error(data):
+                return error
+            if not isinstance(data, dict) or key not in data:
+                return KeeneticRCIError(f"No result for '{self.url}'")
+            data = data[key]
+
+        return _find_rci_error(data) or data
+
+
+def _decode_json(body: bytes) -> Any:
+    return json.loads(body) if body.strip() else None
+
+
+def _decode_batch(body: bytes, items: list[tuple[int, float]]) -> Any:
+    """Decode batch response item by item.
+
+    Size in bytes and decode time of every item are appended to items.
+    """
+    text = body.decode()
+    ascii_only = body.isascii()
+    index = _JSON_WHITESPACE.match(text).end()
+    if not text.startswith("[", index):
+        return _decode_json(body)
+
+    data = []
+    index = _JSON_WHITESPACE.match(text, index + 1).end()
+    while not text.startswith("]", index):
+        if data:
+            if not text.startswith(",", index):
+                raise json.JSONDecodeError("Expecting ',' delimiter",
+                                           text, index)
+            index = _JSON_WHITESPACE.match(text, index + 1).end()
+
+        started = time.perf_counter()
+        item, end = _JSON_DECODER.raw_decode(text, index)
+        decode_time = time.perf_counter() - started
+
+        data.append(item)
+        items.append((end - index if ascii_only
+                      else len(text[index:end].encode()), decode_time))
+        index = _JSON_WHITESPACE.match(text, end).end()
+
+    if _JSON_WHITESPACE.match(text, index + 1).end() != len(text):
+        raise json.JSONDecodeError("Extra data", text, index + 1)
+    return data
+
+
+def _find_rci_error(data: Any) -> KeeneticRCIError | None:
+    """Return error reported by RCI in "status" list of a batch element."""
+    if not isinstance(data, dict):
+        return None
+
+    status = data.get("status")
+    if not isinstance(status, list):
+        return None
+
+    for message in status:
+        if isinstance(message, dict) and \
+                message.get("status") in RCI_ERROR_STATUSES:
+            return KeeneticRCIError(
+                f"{message.get('ident', '')} {message.get('code', '')}: "
+                f"{message.get('message', '')}".strip()
+            )
+    return None
+
+
+def make_client_registered_command(register: bool, mac: str,
+                                   name: str | None = None) -> RCICommand:
+    """Make Register/Unregister network client command."""
+    params = {"mac": mac}
+    if register:
+        params["name"] = name
+    else:
+        params["no"] = True
+    return RCICommand(RCI_KNOWN_HOST, params)
+
+
+def make_client_access_command(permit: bool, mac: str) -> RCICommand:
+    """Make Permit/Deny network client internet access command."""
+    return RCICommand(RCI_HOTSPOT_HOST, {
+        "mac": mac, "access": "permit" if permit else "deny"
+    })
+
+
+@dataclass(frozen=True)
+class ConnectionConfig:
+    """HTTP connection pool settings."""
+    limit_per_host: int = CONNECTION_LIMIT_PER_HOST
+    keepalive_timeout: float = CONNECTION_KEEPALIVE_TIMEOUT
+    connect_timeout: float = CONNECTION_CONNECT_TIMEOUT
+    read_timeout: float = CONNECTION_READ_TIMEOUT
+    total_timeout: float = CONNECTION_TIMEOUT
+
+
+@dataclass
+class ConnectionPoolStats:
+    """HTTP connection pool counters."""
+    connections_opened: int = 0
+    connections_reused: int = 0
+    pool_waits: int = 0
+    pool_wait_time: float = 0
+
+    def make_trace_config(self) -> TraceConfig:
+        """Make trace config updating the counters."""
+        trace_config = TraceConfig()
+        trace_config.on_connection_create_end.append(self._on_connection_create)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuse)
+        trace_config.on_connection_queued_start.append(self._on_queued_start)
+        trace_config.on_connection_queued_end.append(self._on_queued_end)
+        return trace_config
+
+    async def _on_connection_create(
+            self,
+            _session: ClientSession,
+            _ctx: SimpleNamespace,
+            _params: TraceConnectionCreateEndParams
+    ) -> None:
+        self.connections_opened += 1
+
+    async def _on_connection_reuse(
+            self,
+            _session: ClientSession,
+            _ctx: SimpleNamespace,
+            _params: TraceConnectionReuseconnParams
+    ) -> None:
+        self.connections_reused += 1
+
+    async def _on_queued_start(
+            self,
+            _session: ClientSession,
+            ctx: SimpleNamespace,
+            _params: TraceConnectionQueuedStartParams
+    ) -> None:
+        ctx.queued_at = time.monotonic()
+
+    async def _on_queued_end(
+            self,
+            _session: ClientSession,
+            ctx: SimpleNamespace,
+            _params: TraceConnectionQueuedEndParams
+    ) -> None:
+        self.pool_waits += 1
+        self.pool_wait_time += time.monotonic() - ctx.queued_at
+
+
+@dataclass
+class EndpointStats:
+    """Endpoint requests statistics. Times are in seconds.
+
+    Commands executed as part of batch requests get the latency of their
+    batch, response size and decode time of their batch item.
+    """
+    requests: int = 0
+    errors: int = 0
+    # Commands executed as part of batch requests
+    batched: int = 0
+    # Responses and batch items with recorded size and decode time
+    responses: int = 0
+    last_latency: float = 0
+    max_latency: float = 0
+    total_latency: float = 0
+    last_response_bytes: int = 0
+    total_response_bytes: int = 0
+    last_decode_time: float = 0
+    total_decode_time: float = 0
+    latency_histogram: list[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+
+    def record_response(self, latency: float, response_bytes: int,
+                        decode_time: float) -> None:
+        """Record successful response."""
+        self.requests += 1
+        self._record_latency(latency)
+        self._record_body(response_bytes, decode_time)
+
+    def record_error(self, latency: float) -> None:
+        """Record failed request."""
+        self.requests += 1
+        self._record_latency(latency)
+        self.errors += 1
+
+    def record_batched(self, latency: float, error: bool,
+                       item: tuple[int, float]) -> None:
+        """Record command executed in a batch.
+
+        Item is the batch item size and decode time.
+        """
+        self.batched += 1
+        self._record_latency(latency)
+        if error:
+            self.errors += 1
+        self._record_body(*item)
+
+    def _record_body(self, response_bytes: int, decode_time: float) -> None:
+        self.responses += 1
+        self.last_response_bytes = response_bytes
+        self.total_response_bytes += response_bytes
+        self.last_decode_time = decode_time
+        self.total_decode_time += decode_time
+
+    def _record_latency(self, latency: float) -> None:
+        self.last_latency = latency
+        self.max_latency = max(self.max_latency, latency)
+        self.total_latency += latency
+
+        latency_ms = latency * 1000
+        bucket = next(
+            (index for index, bound in enumerate(LATENCY_BUCKETS)
+             if latency_ms <= bound),
+            len(LATENCY_BUCKETS)
+        )
+        self.latency_histogram[bucket] += 1
+
+    def as_dict(self) -> dict:
+        """Return statistics with times in ms and averages."""
+        data = asdict(self)
+        for key in ("last_latency", "max_latency", "total_latency",
+                    "last_decode_time", "total_decode_time"):
+            data[key] = round(data[key] * 1000, 1)
+
+        requests = (self.requests + self.batched) or 1
+        responses = self.responses or 1
+        data["avg_latency"] = round(self.total_latency / requests * 1000, 1)
+        data["avg_decode_time"] = round(
+            self.total_decode_time / responses * 1000, 1)
+        data["avg_response_bytes"] = round(
+            self.total_response_bytes / responses)
+        data["latency_histogram"] = {
+            f"<= {bound} ms": count
+            for bound, count in zip(LATENCY_BUCKETS, self.latency_histogram,
+                                    strict=False)
+        } | {f"> {LATENCY_BUCKETS[-1]} ms": self.latency_histogram[-1]}
+        return data
+
+
+class RequestBudget:
+    """Limit of concurrent requests and request rate shared by clients.
+
+    Rate is limited with a token bucket refilled by rate tokens per second
+    up to burst tokens.
+    """
+
+    def __init__(  # noqa: D107
+        self,
+        max_concurrent: int,
+        rate: float,
+        burst: int,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.max_concurrent = max_concurrent
+        self.rate = rate
+        self.burst = burst
+        self.waits = 0
+        self.wait_time = 0.0
+
+        self._clock = clock
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._lock = asyncio.Lock()
+        self._tokens = float(burst)
+        self._updated = clock()
+
+
+    async def __aenter__(self) -> None:
+        """Wait for a free request slot and a rate token."""
+        started = self._clock()
+        waited = self._semaphore.locked() or self._lock.locked()
+        await self._semaphore.acquire()
+        try:
+            async with self._lock:
+                while (delay := self._take_token()) > 0:
+                    waited = True
+                    await asyncio.sleep(delay)
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+        if waited:
+            self.waits += 1
+            self.wait_time += self._clock() - started
+
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        """Release the request slot."""
+        self._semaphore.release()
+
+
+    def _take_token(self) -> float:
+        """Take a token, return delay until it is available if there is none."""
+        now = self._clock()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0
+        return (1 - self._tokens) / self.rate
+
+
 class KeeneticAPI:
     """API client for Keentic router."""
 
@@ -21,18 +411,48 @@ class KeeneticAPI:
         scheme: str,
         host: str,
         port: str,
-        ssl_validation: bool
+        ssl_validation: bool,
+        cache_ttl: float = 0,
+        connection_config: ConnectionConfig | None = None,
+        connector: BaseConnector | None = None,
+        budget: RequestBudget | None = None
     ) -> None:
         self.base_url = f"{scheme}://{host}:{port}"
+        self.connection_config = connection_config or ConnectionConfig()
+        self.pool_stats = ConnectionPoolStats()
+        self.endpoint_stats: dict[str, EndpointStats] = \
+            defaultdict(EndpointStats)
+        self._budget = budget
         self._session = ClientSession(
             base_url=self.base_url,
-            timeout=ClientTimeout(total=CONNECTION_TIMEOUT),
-            cookie_jar=CookieJar(unsafe=True)
+            # Shared connector limits are used instead of the config ones,
+            # it is not closed with the session
+            connector=connector or TCPConnector(
+                limit_per_host=self.connection_config.limit_per_host,
+                keepalive_timeout=self.connection_config.keepalive_timeout
+            ),
+            connector_owner=connector is None,
+            timeout=ClientTimeout(
+                total=self.connection_config.total_timeout,
+                connect=self.connection_config.connect_timeout,
+                sock_read=self.connection_config.read_timeout
+            ),
+            cookie_jar=CookieJar(unsafe=True),
+            trace_configs=[self.pool_stats.make_trace_config()]
         )
+        # Identical commands in flight share one response
+        self._in_flight: dict[tuple, asyncio.Future] = {}
+        # Read-only commands results: key -> (expiration time, result)
+        self._cache_ttl = cache_ttl
+        self._cache: dict[tuple, tuple[float, Any]] = {}
+        self._prune_handle: asyncio.TimerHandle | None = None
 
 
     async def close(self) -> None:
         """Close session."""
+        if self._prune_handle:
+            self._prune_handle.cancel()
+            self._prune_handle = None
         await self._session.close()
 
 
@@ -71,107 +491,171 @@ class KeeneticAPI:
             url: str,
             params: dict | None = None
     ) -> list | dict | None:
-        async with self._session.get(url=url, params=params) as resp:
-            if resp.status == 200:
-                return await resp.json()
-            resp.raise_for_status()
-            return None
+        return await self._request("GET", url, params=params)
 
 
     async def _post_data(
             self,
             url: str,
-            params: dict | None = None
+            params: dict | list | None = None,
+            decode: Callable[[bytes], Any] = _decode_json
     ) -> list | dict | None:
-        async with self._session.post(url=url, json=params) as resp:
-            if resp.status == 200:
-                return await resp.json()
-            resp.raise_for_status()
-            return None
-
-
-    async def get_system_info(self) -> list | dict:
-        """Get system information."""
-        return await self._get_data("rci/show/defaults")
-
-
-    async def get_system_fw(self) -> list | dict:
-        """Get firmware version."""
-        return await self._get_data("rci/show/version")
-
+        return await self._request("POST", url, decode=decode, json=params)
 
-    async def get_system_stats(self) -> list | dict:
-        """Get system statistics."""
-        return await self._get_data("rci/show/system")
 
-
-    async def get_internet_status(self) -> list | dict:
-        """Get Internet status."""
-        return await self._get_data("rci/show/internet/status")
-
-
-    async def get_interface_stats(self, name: str) -> list | dict:
-        """Get interface statistics."""
-        return await self._get_data(
-            url="rci/show/interface/stat",
-            params={"name": name}
-        )
-
-
-    async def get_interface_speed(self, name: str, direction: str,
-                                  detail: int = 1) -> list | dict:
-        """Get interface speed.
-
-        Args:
-            name: interface name
-            direction: "rxspeed", "txspeed".
-            detail: 0 - 3s, 1 - 60s, 2 - 180s, 3 - 1440s
+    async def _request(
+            self,
+            method: str,
+            url: str,
+            decode: Callable[[bytes], Any] = _decode_json,
+            **kwargs: Any
+    ) -> list | dict | None:
+        """Make request, record endpoint statistics."""
+        stats = self.endpoint_stats[url]
+        async with self._budget or nullcontext():
+            started = time.monotonic()
+            try:
+                async with self._session.request(method, url=url,
+                                                 **kwargs) as resp:
+                    if resp.status == 200:
+                        body = await resp.read()
+                        received = time.monotonic()
+                        data = decode(body)
+                        stats.record_response(
+                            latency=received - started,
+                            response_bytes=len(body),
+                            decode_time=time.monotonic() - received
+                        )
+                        return data
+                    resp.raise_for_status()
+                    return None
+            except Exception:
+                stats.record_error(time.monotonic() - started)
+                raise
+
+
+    async def execute_batch(self, commands: list[RCICommand]) -> list:
+        """Execute several RCI commands in one request.
+
+        Returns results in the order of commands. Result of a failed
+        command is KeeneticRCIError instance.
+
+        Read-only commands which are already in flight are not sent again,
+        their results are shared. Cached results of read-only commands are
+        used while not expired. Write commands are always sent.
         """
-        return await self._get_data(
-            url="rci/show/interface/rrd",
-            params={"name": name, "attribute": direction, "detail": detail}
-        )
-
-
-    async def get_network_clients(self) -> list | dict:
-        """Get connected network clients."""
-        data = (await self._get_data("rci/show/ip/hotspot"))["host"]
-        return {el["mac"].lower(): el for el in data if "mac" in el}
-
-
-    async def get_clients_speed(self, direction: str,
-                                detail: int = 0) -> list:
-        """Get network clients speed.
-
-        Args:
-            direction: "rxspeed", "txspeed"
-            detail: 0 - 3s, 1 - 60s, 2 - 180s, 3 - 1440s
+        now = time.monotonic()
+        results = {}
+        shared = {}
+        requested = {}
+        for command in commands:
+            key = command.key
+            if key in results or key in shared or key in requested:
+                continue
+
+            cached = self._cache.get(key)
+            if cached and cached[0] > now:
+                results[key] = cached[1]
+            elif command.read_only and key in self._in_flight:
+                shared[key] = self._in_flight[key]
+            else:
+                requested[key] = command
+
+        if requested:
+            results.update(await self._send_batch(list(requested.values())))
+
+        for key, future in shared.items():
+            results[key] = await asyncio.shield(future)
+
+        return [results[command.key] for command in commands]
+
+
+    async def _send_batch(self, commands: list[RCICommand]) -> dict:
+        """Send batch request, return results by command key."""
+        loop = asyncio.get_running_loop()
+        futures = {}
+        for command in commands:
+            if not command.read_only:
+                continue
+            future = futures[command.key] = loop.create_future()
+            # Nobody may wait for shared result
+            future.add_done_callback(
+                lambda f: f.cancelled() or f.exception())
+            self._in_flight[command.key] = future
+
+        # Size and decode time of every batch item
+        items: list[tuple[int, float]] = []
+        try:
+            data = await self._post_data(
+                url=RCI_BATCH_URL,
+                params=[command.as_batch_item() for command in commands],
+                decode=lambda body: _decode_batch(body, items)
+            )
+            if not isinstance(data, list) or len(data) != len(commands):
+                raise KeeneticRCIError("Unexpected batch response")
+        except asyncio.CancelledError:
+            for future in futures.values():
+                future.cancel()
+            raise
+        except Exception as ex:
+            for future in futures.values():
+                future.set_exception(ex)
+            raise
+        finally:
+            for key, future in futures.items():
+                # Dropped by clear_cache() and maybe replaced by a newer read
+                if self._in_flight.get(key) is future:
+                    del self._in_flight[key]
+
+        results = {}
+        expiration = time.monotonic() + self._cache_ttl
+        latency = self.endpoint_stats[RCI_BATCH_URL].last_latency
+        for index, (command, item) in enumerate(zip(commands, data,
+                                                    strict=True)):
+            result = results[command.key] = command.extract_result(item)
+            if future := futures.get(command.key):
+                future.set_result(result)
+            self.endpoint_stats[command.url].record_batched(
+                latency=latency,
+                error=isinstance(result, Exception),
+                item=items[index]
+            )
+
+            if self._cache_ttl and command.read_only and \
+                    not isinstance(result, Exception):
+                self._cache[command.key] = (expiration, result)
+
+        if self._cache and self._prune_handle is None:
+            self._prune_handle = loop.call_later(self._cache_ttl,
+                                                 self._prune_cache)
+        return results
+
+
+    def _prune_cache(self) -> None:
+        """Drop expired cached results."""
+        self._prune_handle = None
+        now = time.monotonic()
+        for key in [key for key, (expiration, _) in self._cache.items()
+                    if expiration <= now]:
+            del self._cache[key]
+
+        if self._cache:
+            self._prune_handle = asyncio.get_running_loop().call_later(
+                min(expiration for expiration, _ in self._cache.values()) - now,
+                self._prune_cache
+            )
+
+
+    def clear_cache(self) -> None:
+        """Drop cached results, e.g. after router settings change.
+
+        Reads in flight may have started before the change, the next
+        identical commands are sent again instead of sharing them.
         """
-        data = (await self._get_data(
-            url="rci/show/ip/hotspot/summary",
-            params={'attribute': direction, "detail": detail}
-        ))["host"]
-
-        return {el["mac"].lower(): el for el in data if "mac" in el}
-
-
-    async def set_client_registered_setting(self, register: bool, mac: str,
-                                            name: str | None = None) -> list | dict:
-        """Register/Uregister network client."""
-        params = {"mac": mac}
-        if register:
-            params["name"] = name
-        else:
-            params["no"] = True
+        self._cache.clear()
+        self._in_flight.clear()
 
-        return await self._post_data(url="rci/known/host", params=params)
 
-
-    async def set_client_internet_access_setting(self, permit: bool,
-                                                 mac: str) -> list | dict:
-        """Permit/Deny network client internet access."""
-        access = "permit" if permit else "deny"
-        return await self._post_data(
-            url="rci/ip/hotspot/host",
-            params={"mac": mac, "access": access}
-        )
+    async def get_system_info(self) -> list | dict:
+        """Get system information."""
+        return await self._get_data(RCI_SYSTEM_INFO)
@@ -20,9 +20,13 @@ from .const import (
     BaseKeeneticEntityDescription,
 )
 from .entity import (
+    INTERFACE_KEY_PREFIX,
+    BaseKeeneticInterfaceEntity,
     BaseKeeneticNetworkClientEntity,
     BaseKeeneticRouterEntity,
     add_network_client_entities,
+    interface_entity_key,
+    remove_stale_router_entities,
 )
 from .router import KeeneticRouter
 
@@ -34,6 +38,15 @@ class RouterGeneralBinarySensor(BaseKeeneticRouterEntity, BinarySensorEntity):
         return self._get_coordinator_data().get(self.entity_description.key)
 
 
+class InterfaceBinarySensor(BaseKeeneticInterfaceEntity, BinarySensorEntity):
+    """Selected interface connection status."""
+    @property
+    def is_on(self) -> bool | None:  # noqa: D102
+        if (connected := self._get_coordinator_data().get("connected")) is None:
+            return None
+        return connected == "yes"
+
+
 class NetworkClientGeneralBinarySensor(
     BaseKeeneticNetworkClientEntity, BinarySensorEntity):
     """Network client binary sensor."""
@@ -48,6 +61,12 @@ class RouterBinarySensorDescription(
     """Router binary sensor description."""
 
 
+@dataclass
+class InterfaceBinarySensorDescription(RouterBinarySensorDescription):
+    """Selected interface binary sensor description."""
+    interface: str = None
+
+
 @dataclass
 class NetworkClientBinarySensorDescription(
     BaseKeeneticEntityDescription, BinarySensorEntityDescription):
@@ -90,6 +109,28 @@ NETWORK_CLIENT_BINARY_SENSORS: tuple[NetworkClientBinarySensorDescription, ...]
 )
 
 
+def make_interface_binary_sensors(
+    interfaces: list[str]
+) -> list[InterfaceBinarySensorDescription]:
+    """Make status binary sensors descriptions of the interfaces."""
+    return [
+        InterfaceBinarySensorDescription(
+            key=interface_entity_key(interface, "status"),
+            translation_key="interface_status",
+            translation_placeholders={"interface": interface},
+            device_class=BinarySensorDeviceClass.CONNECTIVITY,
+            update_coordinator=UPDATE_COORDINATOR_IF_STATS,
+            extra_attributes={"Description": "description",
+                              "Type": "type",
+                              "State": "state",
+                              "Link": "link"},
+            entity_class=InterfaceBinarySensor,
+            interface=interface
+        )
+        for interface in interfaces
+    ]
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -99,10 +140,13 @@ async def async_setup_entry(
     router: KeeneticRouter = hass.data[DOMAIN][config_entry.entry_id]
 
     # Add Router binary sensors
+    interface_sensors = make_interface_binary_sensors(router.selected_interfaces)
+    remove_stale_router_entities(hass, router, "binary_sensor",
+                                 INTERFACE_KEY_PREFIX, interface_sensors)
     router_sensors = [
         description.entity_class(
             router, description
-        ) for description in ROUTER_BINARY_SENSORS
+        ) for description in (*ROUTER_BINARY_SENSORS, *interface_sensors)
     ]
     async_add_entities(router_sensors)
 
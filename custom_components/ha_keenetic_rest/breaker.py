@@ -0,0 +1,90 @@
+"""Circuit breaker for router requests."""
+
+from collections.abc import Callable
+import random
+import time
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Request rejected while the circuit is open."""
+
+    def __init__(self, retry_in: float) -> None:  # noqa: D107
+        super().__init__(f"Router is unavailable, next try in {retry_in:.0f} s")
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Stop sending requests to the router after consecutive failures.
+
+    After failure_threshold failures the circuit opens and requests fail
+    fast. When reset_timeout passes, one probe request is let through
+    (half-open state): its success closes the circuit, its failure opens
+    the circuit again.
+    """
+
+    def __init__(  # noqa: D107
+        self,
+        failure_threshold: int,
+        reset_timeout: float,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = STATE_CLOSED
+        self.failures = 0
+
+        self._clock = clock
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._probe_started = 0.0
+
+
+    def before_request(self) -> None:
+        """Check that the request may be sent.
+
+        Raises CircuitOpenError if the circuit is open.
+        """
+        if self.state == STATE_CLOSED:
+            return
+
+        now = self._clock()
+        retry_in = self._opened_at + self.reset_timeout - now
+        if self.state == STATE_OPEN and retry_in <= 0:
+            self.state = STATE_HALF_OPEN
+            self._probe_in_flight = False
+
+        # Probe result may be lost if the request was cancelled
+        if self.state == STATE_HALF_OPEN and (
+                not self._probe_in_flight or
+                now - self._probe_started > self.reset_timeout):
+            self._probe_in_flight = True
+            self._probe_started = now
+            return
+
+        raise CircuitOpenError(max(retry_in, 0))
+
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self._probe_in_flight = False
+
+
+    def record_failure(self) -> None:
+        """Count failed request, open the circuit if needed."""
+        self.failures += 1
+        if self.state == STATE_HALF_OPEN or \
+                self.failures >= self.failure_threshold:
+            self.state = STATE_OPEN
+            self._opened_at = self._clock()
+            self._probe_in_flight = False
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Full jitter exponential backoff delay."""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
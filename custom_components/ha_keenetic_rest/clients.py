@@ -0,0 +1,173 @@
+"""Network clients store."""
+
+from typing import Any
+
+
+class ClientInterface:
+    """Network client interface."""
+    __slots__ = ("description", "id", "name")
+
+    def __init__(self, data: dict) -> None:  # noqa: D107
+        self.id = data.get("id")
+        self.name = data.get("name")
+        self.description = data.get("description")
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get field value like from a dict."""
+        if key in self.__slots__:
+            return getattr(self, key)
+        return default
+
+    def matches(self, name: str) -> bool:
+        """Whether interface id, name or description is the name.
+
+        Comparison is case-insensitive.
+        """
+        name = name.casefold()
+        return any(
+            isinstance(value, str) and value.casefold() == name
+            for value in (self.id, self.name, self.description)
+        )
+
+    def as_dict(self) -> dict:
+        """Return interface as dict."""
+        return {field: getattr(self, field) for field in self.__slots__}
+
+
+class NetworkClient:
+    """Network client record with the fields used by the integration.
+
+    Field names match "show ip hotspot" host keys.
+    """
+    __slots__ = (
+        "access",
+        "active",
+        "hostname",
+        "interface",
+        "ip",
+        "mac",
+        "name",
+        "port",
+        "registered",
+        "rssi",
+        "rxbytes",
+        "security",
+        "speed",
+        "ssid",
+        "txbytes",
+    )
+
+    def __init__(self, mac: str) -> None:  # noqa: D107
+        for field in self.__slots__:
+            setattr(self, field, None)
+        self.mac = mac
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get field value like from a dict."""
+        if key in self.__slots__:
+            return getattr(self, key)
+        return default
+
+    def __getitem__(self, key: str) -> Any:  # noqa: D105
+        if key in self.__slots__:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def as_dict(self) -> dict:
+        """Return client as dict."""
+        data = {field: getattr(self, field) for field in self.__slots__}
+        if self.interface:
+            data["interface"] = self.interface.as_dict()
+        return data
+
+
+class NetworkClientStore:
+    """Network clients records updated in place on every poll."""
+
+    def __init__(self) -> None:  # noqa: D107
+        self.clients: dict[str, NetworkClient] = {}
+        # Changed fields of every changed client since the last pop,
+        # added and removed clients have None instead of fields
+        self.changes: dict[str, set | None] = {}
+        self._interfaces: dict[tuple, ClientInterface] = {}
+
+
+    def update(self, hosts: list[dict]) -> None:
+        """Update records with "show ip hotspot" hosts."""
+        seen = set()
+        for host in hosts:
+            if "mac" not in host:
+                continue
+
+            client_id = host["mac"].lower()
+            seen.add(client_id)
+
+            client = self.clients.get(client_id)
+            if client is None:
+                client = self.clients[client_id] = NetworkClient(client_id)
+                self._update_client(client, host)
+                self.changes[client_id] = None
+            elif fields := self._update_client(client, host):
+                self.mark_changed(client_id, fields)
+
+        for client_id in self.clients.keys() - seen:
+            del self.clients[client_id]
+            self.changes[client_id] = None
+
+        # Drop interfaces of gone clients, e.g. of guest networks
+        used = {client.interface for client in self.clients.values()}
+        used.discard(None)
+        if len(self._interfaces) > len(used):
+            self._interfaces = {
+                key: interface for key, interface in self._interfaces.items()
+                if interface in used
+            }
+
+
+    def mark_changed(self, client_id: str, fields: set) -> None:
+        """Add changed fields of a client."""
+        if client_id not in self.changes:
+            self.changes[client_id] = set(fields)
+        elif self.changes[client_id] is not None:
+            self.changes[client_id].update(fields)
+
+
+    def set_field(self, client_id: str, field: str, value: Any) -> bool:
+        """Set field of a known client, return whether it changed."""
+        client = self.clients.get(client_id)
+        if client is None or getattr(client, field) == value:
+            return False
+
+        setattr(client, field, value)
+        self.mark_changed(client_id, {field})
+        return True
+
+
+    def pop_changes(self) -> dict[str, set | None]:
+        """Return and reset changes."""
+        changes, self.changes = self.changes, {}
+        return changes
+
+
+    def _update_client(self, client: NetworkClient, host: dict) -> set:
+        changed = set()
+        for field in NetworkClient.__slots__:
+            if field == "mac":
+                continue
+
+            value = host.get(field)
+            if field == "interface" and value is not None:
+                value = self._get_interface(value)
+
+            if getattr(client, field) != value:
+                setattr(client, field, value)
+                changed.add(field)
+        return changed
+
+
+    def _get_interface(self, data: dict) -> ClientInterface:
+        """Get shared interface record."""
+        key = (data.get("id"), data.get("name"), data.get("description"))
+        if key not in self._interfaces:
+            self._interfaces[key] = ClientInterface(data)
+        return self._interfaces[key]
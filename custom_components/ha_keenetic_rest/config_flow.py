@@ -6,7 +6,12 @@ from typing import Any, Mapping  # noqa: UP035
 from aiohttp import ClientError, InvalidURL
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
 from homeassistant.const import (
     CONF_HOST,
     CONF_NAME,
@@ -16,25 +21,38 @@ from homeassistant.const import (
     CONF_USERNAME,
     #    CONF_VERIFY_SSL,
 )
+from homeassistant.core import callback
 from homeassistant.helpers import config_validation as cv
 
 #from homeassistant.helpers import selector
 from .api import KeeneticAPI
 from .const import (
     ABORT_WRONG_ROUTER,
+    CONF_CLIENT_SPEED_SENSORS,
+    CONF_INTERFACES,
+    CONF_MAX_POLL_INTERVAL,
+    CONF_MIN_POLL_INTERVAL,
+    CONF_SPEED_STATISTICS,
+    CONF_SYSLOG_PORT,
+    CONF_TOP_TALKERS,
     DEFAULT_HOST,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
     DEFAULT_NAME,
     DEFAULT_PORT,
+    DEFAULT_TOP_TALKERS,
     DOMAIN,
     ERROR_CANNOT_CONNECT,
     ERROR_INVALID_CREDENTIALS,
+    ERROR_INVALID_POLL_INTERVALS,
     ERROR_INVALID_URL,
     ERROR_UNKNOWN,
     ERROR_UNSUPPORTED,
+    MAX_TOP_TALKERS,
     PROTOCOL_HTTP,
     # PROTOCOL_HTTPS,
 )
-from .router import KeeneticAuthFailed
+from .router import KeeneticAuthFailed, KeeneticRouter
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -69,6 +87,14 @@ async def validate_credentials(user_input: dict[str, Any]) -> str:
 class KeenticConfigFlow(ConfigFlow, domain=DOMAIN):  # noqa: D101
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: ConfigEntry
+    ) -> OptionsFlow:
+        """Get options flow."""
+        return KeeneticOptionsFlow()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -178,3 +204,67 @@ class KeenticConfigFlow(ConfigFlow, domain=DOMAIN):  # noqa: D101
             data_schema=vol.Schema(schema),
             errors=errors
         )
+
+
+class KeeneticOptionsFlow(OptionsFlow):
+    """Keenetic options flow."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage options."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            if user_input[CONF_MIN_POLL_INTERVAL] > \
+                    user_input[CONF_MAX_POLL_INTERVAL]:
+                errors["base"] = ERROR_INVALID_POLL_INTERVALS
+            else:
+                return self.async_create_entry(data=user_input)
+
+        options = user_input or self.config_entry.options
+        schema = {
+            vol.Required(
+                CONF_MIN_POLL_INTERVAL,
+                default=options.get(CONF_MIN_POLL_INTERVAL,
+                                    DEFAULT_MIN_POLL_INTERVAL)
+            ): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+            vol.Required(
+                CONF_MAX_POLL_INTERVAL,
+                default=options.get(CONF_MAX_POLL_INTERVAL,
+                                    DEFAULT_MAX_POLL_INTERVAL)
+            ): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+            vol.Required(
+                CONF_SPEED_STATISTICS,
+                default=options.get(CONF_SPEED_STATISTICS, False)
+            ): bool,
+            vol.Required(
+                CONF_CLIENT_SPEED_SENSORS,
+                default=options.get(CONF_CLIENT_SPEED_SENSORS, True)
+            ): bool,
+            vol.Required(
+                CONF_TOP_TALKERS,
+                default=options.get(CONF_TOP_TALKERS, DEFAULT_TOP_TALKERS)
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_TOP_TALKERS)),
+            vol.Required(
+                CONF_SYSLOG_PORT,
+                default=options.get(CONF_SYSLOG_PORT, 0)
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=65535)),
+        }
+
+        # Interfaces are known while the router is loaded
+        router: KeeneticRouter | None = self.hass.data.get(DOMAIN, {}).\
+            get(self.config_entry.entry_id)
+        interfaces = router.get_interface_labels() if router else {
+            name: name for name in options.get(CONF_INTERFACES, [])
+        }
+        schema[vol.Required(
+            CONF_INTERFACES,
+            default=[name for name in options.get(CONF_INTERFACES, [])
+                     if name in interfaces]
+        )] = cv.multi_select(interfaces)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(schema),
+            errors=errors
+        )
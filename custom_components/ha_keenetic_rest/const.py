@@ -5,8 +5,24 @@ from dataclasses import dataclass
 from homeassistant.helpers.entity import EntityDescription
 
 DOMAIN = 'ha_keenetic_rest'
+# hass.data key of resources shared by all routers
+DATA_FLEET = f"{DOMAIN}_fleet"
 
 CONNECTION_TIMEOUT = 30
+CONNECTION_CONNECT_TIMEOUT = 5
+CONNECTION_READ_TIMEOUT = 20
+# Keep connections open between polls
+CONNECTION_KEEPALIVE_TIMEOUT = 75
+CONNECTION_LIMIT_PER_HOST = 4
+# All routers share one connection pool and request budget
+FLEET_CONNECTION_LIMIT = 100
+FLEET_MAX_CONCURRENT_REQUESTS = 16
+FLEET_REQUEST_RATE = 20
+FLEET_REQUEST_BURST = 20
+# Results of show commands are reused by requests within the TTL
+RCI_CACHE_TTL = 2
+# Settings changes made within the window are sent as one RCI batch
+RCI_WRITE_WINDOW = 0.3
 
 DEFAULT_NAME = "Keenetic"
 DEFAULT_HOST = "192.168.1.1"
@@ -15,6 +31,19 @@ DEFAULT_PORT = 80
 PROTOCOL_HTTP = "HTTP"
 PROTOCOL_HTTPS = "HTTPS"
 
+CONF_MIN_POLL_INTERVAL = "min_poll_interval"
+CONF_MAX_POLL_INTERVAL = "max_poll_interval"
+CONF_SPEED_STATISTICS = "speed_statistics"
+CONF_CLIENT_SPEED_SENSORS = "client_speed_sensors"
+CONF_TOP_TALKERS = "top_talkers"
+CONF_SYSLOG_PORT = "syslog_port"
+CONF_INTERFACES = "interfaces"
+
+DEFAULT_MIN_POLL_INTERVAL = 10
+DEFAULT_MAX_POLL_INTERVAL = 300
+DEFAULT_TOP_TALKERS = 3
+MAX_TOP_TALKERS = 10
+
 CONF_DATA_SERIAL = "serial"
 CONF_DATA_MODEL = "product"
 CONF_DATA_MODEL_ID = "ndmhwid"
@@ -23,6 +52,7 @@ ERROR_INVALID_URL = "invalid_url"
 ERROR_CANNOT_CONNECT = "cannot_connect"
 ERROR_INVALID_CREDENTIALS = "invalid_credentials"
 ERROR_UNSUPPORTED = "unsupported"
+ERROR_INVALID_POLL_INTERVALS = "invalid_poll_intervals"
 ERROR_UNKNOWN = "unknown"
 
 ABORT_ALREADY_CONFIGURED = "already_configured"
@@ -32,12 +62,30 @@ UPDATE_COORDINATOR_SYS_FW = "system firmware"
 UPDATE_COORDINATOR_SYS_STATS = "system statistics"
 UPDATE_COORDINATOR_INTERNET_STATUS = "internet status"
 UPDATE_COORDINATOR_IF_STATS = "interfaces statistics"
+UPDATE_COORDINATOR_INTERFACES = "interfaces"
 UPDATE_COORDINATOR_CLIENTS = "network clients"
-UPDATE_COORDINATOR_CLIENTS_RX_SPEED = "network clients RX speed"
-UPDATE_COORDINATOR_CLIENTS_TX_SPEED = "network clients TX speed"
+UPDATE_COORDINATOR_DIAGNOSTICS = "diagnostics"
 
 SIGNAL_NEW_NETWORK_CLIENTS = "signal_new_network_clients"
 
+STORAGE_VERSION = 1
+# Delay of the last known snapshot save after data changes
+SNAPSHOT_SAVE_DELAY = 10
+
+SERVICE_PROFILE_REFRESH = "profile_refresh"
+SERVICE_SET_CLIENTS_ACCESS = "set_clients_access"
+SERVICE_SET_CLIENTS_REGISTERED = "set_clients_registered"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_CYCLES = "cycles"
+ATTR_ACCESS = "access"
+ATTR_REGISTER = "register"
+# Network clients selectors
+ATTR_MACS = "macs"
+ATTR_REGISTERED = "registered"
+ATTR_ACTIVE = "active"
+ATTR_SEGMENT = "segment"
+DEFAULT_PROFILE_CYCLES = 5
+
 
 @dataclass
 class BaseKeeneticEntityDescription(EntityDescription):
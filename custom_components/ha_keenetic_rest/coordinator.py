@@ -0,0 +1,63 @@
+"""Keenetic update coordinators."""
+
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+
+class NetworkClientsCoordinator(DataUpdateCoordinator):
+    """Network clients coordinator notifying listeners only about changes.
+
+    Listener context is (client_id, fields): the listener is called only
+    if one of the fields of its client changed since the previous update.
+    Listeners without context are called on every update.
+    """
+
+    def __init__(  # noqa: D107
+        self,
+        *args: Any,
+        pop_changes: Callable[[], dict[str, set | None]],
+        **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        # Changed fields of every changed client, added and removed
+        # clients have None instead of fields
+        self.changes: dict[str, set | None] = {}
+        # All clients are reported changed because availability changed,
+        # e.g. on the first live update after the snapshot restore
+        self.full_refresh = False
+
+        self._pop_changes = pop_changes
+        self._last_update_success: bool | None = None
+
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Call listeners of changed clients."""
+        changes = self._pop_changes()
+
+        if self.last_update_success != self._last_update_success:
+            # Availability changed, all entities have to be updated
+            self._last_update_success = self.last_update_success
+            self.changes = dict.fromkeys(self.data or {})
+            self.full_refresh = True
+            super().async_update_listeners()
+            return
+
+        self.changes = changes
+        self.full_refresh = False
+        for update_callback, context in list(self._listeners.values()):
+            if context is None:
+                update_callback()
+                continue
+
+            client_id, fields = context
+            if client_id not in changes:
+                continue
+
+            changed_fields = changes[client_id]
+            if changed_fields is None or fields is None or \
+                    not changed_fields.isdisjoint(fields):
+                update_callback()
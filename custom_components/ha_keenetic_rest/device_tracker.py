@@ -23,6 +23,7 @@ from .router import KeeneticRouter
 
 class NetworkClientScanner(BaseKeeneticNetworkClientEntity, ScannerEntity):
     """Network client scanner."""
+    _client_fields = ("active", "hostname", "ip", "mac")
 
     @property
     def is_connected(self) -> bool:  # noqa: D102
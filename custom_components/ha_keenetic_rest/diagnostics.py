@@ -0,0 +1,49 @@
+"""Keenetic config entry diagnostics."""
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_DATA_SERIAL, DOMAIN
+from .router import KeeneticRouter
+
+TO_REDACT = {CONF_PASSWORD, CONF_USERNAME, CONF_DATA_SERIAL}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return requests and polling diagnostics."""
+    router: KeeneticRouter = hass.data[DOMAIN][config_entry.entry_id]
+
+    return {
+        "config_entry": {
+            "data": async_redact_data(dict(config_entry.data), TO_REDACT),
+            "options": dict(config_entry.options)
+        },
+        "requests": router.get_request_stats(),
+        "connection_pool": asdict(router.api.pool_stats),
+        "fleet_budget": {
+            "max_concurrent": router.fleet.budget.max_concurrent,
+            "rate": router.fleet.budget.rate,
+            "waits": router.fleet.budget.waits,
+            "wait_time": round(router.fleet.budget.wait_time, 3)
+        } if router.fleet else None,
+        "poll_intervals": {
+            name: topic.interval.total_seconds()
+            for name, topic in router.scheduler.topics.items()
+        },
+        "unchanged_polls": {
+            name: topic.unchanged_polls
+            for name, topic in router.scheduler.topics.items()
+        },
+        "coordinators": {
+            name: coordinator.last_update_success
+            for name, coordinator in router.update_coordinators.items()
+        },
+        "network_clients": len(router.get_network_clients_data() or {})
+    }
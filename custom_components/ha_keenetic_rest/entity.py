@@ -2,14 +2,19 @@
 
 from typing import Any
 
-from homeassistant.core import callback
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import slugify
 
 from .const import BaseKeeneticEntityDescription
 from .router import KeeneticRouter
 
+# Entity description key prefix of selected interfaces entities
+INTERFACE_KEY_PREFIX = "interface_"
+
 
 class BaseKeeneticEntity(CoordinatorEntity):
     """Base class for all integration entities."""
@@ -19,11 +24,12 @@ class BaseKeeneticEntity(CoordinatorEntity):
     def __init__(  # noqa: D107
         self,
         router: KeeneticRouter,
-        entity_description: BaseKeeneticEntityDescription
+        entity_description: BaseKeeneticEntityDescription,
+        context: Any = None
     ) -> None:
         coordinator = router.\
             update_coordinators[entity_description.update_coordinator]
-        super().__init__(coordinator)
+        super().__init__(coordinator, context)
 
         self.router = router
         self.entity_description = entity_description
@@ -94,17 +100,35 @@ class BaseKeeneticRouterEntity(BaseKeeneticEntity):
 
 class BaseKeeneticNetworkClientEntity(BaseKeeneticEntity):
     """Base class for Network client entities."""
+    # Client data fields used by the entity besides its key and attributes
+    _client_fields: tuple[str, ...] = ()
+
     def __init__(  # noqa: D107
         self,
         router: KeeneticRouter,
         entity_description: BaseKeeneticEntityDescription,
         client_id: str
     ) -> None:
-        super().__init__(router, entity_description)
+        # Coordinator notifies the entity only when its fields are changed
+        super().__init__(router, entity_description,
+                         context=(client_id, self.client_fields(entity_description)))
         self.client_id = client_id
         self._attr_unique_id = \
             f"{router.unique_id}-{client_id}-{entity_description.key}".lower()
 
+    @classmethod
+    def client_fields(
+        cls,
+        entity_description: BaseKeeneticEntityDescription
+    ) -> frozenset:
+        """Client data fields used by the entity."""
+        fields = {entity_description.key, *cls._client_fields}
+        if entity_description.extra_attributes:
+            for attr_key in entity_description.extra_attributes.values():
+                fields.add(next(iter(attr_key))
+                           if type(attr_key) is dict else attr_key)
+        return frozenset(fields)
+
     @property
     def available(self) -> bool:  # noqa: D102
         return super().available and self.client_id in self.coordinator.data
@@ -136,3 +160,48 @@ def add_network_client_entities(
         ) for description in entity_descriptions for client_id in client_ids
     ]
     async_add_entities(network_client_sensors)
+
+
+class BaseKeeneticInterfaceEntity(BaseKeeneticRouterEntity):
+    """Base class for selected interface entities of the Router."""
+    @property
+    def available(self) -> bool:  # noqa: D102
+        # Interface failed to fetch, e.g. removed on the router
+        return super().available and \
+            self.entity_description.interface in (self.coordinator.data or {})
+
+    def _get_coordinator_data(self) -> dict:
+        return super()._get_coordinator_data().\
+            get(self.entity_description.interface, {})
+
+
+def interface_entity_key(interface: str, key: str) -> str:
+    """Make entity description key of the interface entity."""
+    return f"{INTERFACE_KEY_PREFIX}{slugify(interface)}_{key}"
+
+
+@callback
+def remove_stale_router_entities(
+    hass: HomeAssistant,
+    router: KeeneticRouter,
+    domain: str,
+    key_prefix: str,
+    entity_descriptions: list[BaseKeeneticEntityDescription]
+) -> None:
+    """Remove registered Router entities not configured anymore.
+
+    Entities with the key prefix which are not described by the
+    descriptions are removed, e.g. of deselected interfaces.
+    """
+    entity_registry = er.async_get(hass)
+    prefix = f"{router.unique_id}-{key_prefix}".lower()
+    unique_ids = {
+        f"{router.unique_id}-{description.key}".lower()
+        for description in entity_descriptions
+    }
+
+    for entry in er.async_entries_for_config_entry(
+            entity_registry, router.config_entry.entry_id):
+        if entry.domain == domain and entry.unique_id.startswith(prefix) \
+                and entry.unique_id not in unique_ids:
+            entity_registry.async_remove(entry.entity_id)
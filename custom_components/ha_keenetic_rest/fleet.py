@@ -0,0 +1,65 @@
+"""Resources shared by all Keenetic routers."""
+
+from aiohttp import TCPConnector
+
+from .api import RequestBudget
+from .const import (
+    CONNECTION_KEEPALIVE_TIMEOUT,
+    CONNECTION_LIMIT_PER_HOST,
+    FLEET_CONNECTION_LIMIT,
+    FLEET_MAX_CONCURRENT_REQUESTS,
+    FLEET_REQUEST_BURST,
+    FLEET_REQUEST_RATE,
+)
+
+
+def poll_phase(slot: int) -> float:
+    """Poll phase of the slot as a fraction of the poll period.
+
+    Van der Corput sequence 0, 1/2, 1/4, 3/4, 1/8, ... keeps phases of
+    any number of routers evenly spread without moving existing ones.
+    """
+    phase = 0.0
+    denominator = 1
+    while slot:
+        denominator *= 2
+        slot, bit = divmod(slot, 2)
+        phase += bit / denominator
+    return phase
+
+
+class KeeneticFleet:
+    """Connection pool, request budget and poll phases of all routers."""
+
+    def __init__(self) -> None:  # noqa: D107
+        self.connector = TCPConnector(
+            limit=FLEET_CONNECTION_LIMIT,
+            limit_per_host=CONNECTION_LIMIT_PER_HOST,
+            keepalive_timeout=CONNECTION_KEEPALIVE_TIMEOUT
+        )
+        self.budget = RequestBudget(
+            max_concurrent=FLEET_MAX_CONCURRENT_REQUESTS,
+            rate=FLEET_REQUEST_RATE,
+            burst=FLEET_REQUEST_BURST
+        )
+        # Config entry id -> poll phase slot
+        self._slots: dict[str, int] = {}
+
+
+    def register(self, entry_id: str) -> float:
+        """Add router, return its poll phase."""
+        if entry_id not in self._slots:
+            used = set(self._slots.values())
+            self._slots[entry_id] = next(
+                slot for slot in range(len(used) + 1) if slot not in used)
+        return poll_phase(self._slots[entry_id])
+
+
+    def unregister(self, entry_id: str) -> None:
+        """Remove router, its phase slot is reused."""
+        self._slots.pop(entry_id, None)
+
+
+    async def close(self) -> None:
+        """Close shared connections."""
+        await self.connector.close()
@@ -0,0 +1,181 @@
+"""Import router RRD history into long-term statistics."""
+
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+import datetime
+import logging
+import statistics
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfDataRate
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util, slugify
+
+from .api import RCI_INTERFACE_RRD, RCICommand
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+RRD_DIRECTIONS = ("rxspeed", "txspeed")
+# RRD detail level -> history span fetched with it
+RRD_DETAIL_SPANS = {
+    2: datetime.timedelta(hours=3),
+    3: datetime.timedelta(hours=24),
+}
+# RRD detail level -> sample step
+RRD_DETAIL_STEPS = {
+    2: datetime.timedelta(seconds=180),
+    3: datetime.timedelta(seconds=1440),
+}
+STATISTICS_PERIOD = datetime.timedelta(hours=1)
+
+
+def make_hourly_statistics(
+    samples: list[dict],
+    step: datetime.timedelta,
+    after: datetime.datetime | None,
+    now: datetime.datetime
+) -> list[StatisticData]:
+    """Make hourly mean, min and max from RRD samples.
+
+    Only complete hours after the last imported one which are fully
+    covered by the samples are included.
+    """
+    if not samples:
+        return []
+
+    oldest = dt_util.utc_from_timestamp(min(sample["t"] for sample in samples))
+    hours = defaultdict(list)
+    for sample in samples:
+        start = dt_util.utc_from_timestamp(sample["t"]).replace(
+            minute=0, second=0, microsecond=0)
+        if start + STATISTICS_PERIOD > now or start + step < oldest:
+            continue
+        if after and start <= after:
+            continue
+        hours[start].append(sample["v"])
+
+    return [
+        StatisticData(
+            start=start,
+            mean=statistics.fmean(values),
+            min=min(values),
+            max=max(values)
+        ) for start, values in sorted(hours.items())
+    ]
+
+
+class RRDStatisticsImporter:
+    """Import interfaces speed RRD history as external statistics.
+
+    Every run imports complete hours after the last imported one, so hours
+    missed while Home Assistant or the router was down are filled from the
+    router history (up to the longest RRD span).
+    """
+
+    def __init__(  # noqa: D107
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        fetch: Callable[[list[RCICommand]], Awaitable[list]],
+        interfaces: Callable[[], list[str]]
+    ) -> None:
+        self.hass = hass
+        self.config_entry = config_entry
+        self._fetch = fetch
+        self._interfaces = interfaces
+
+
+    def statistic_id(self, interface: str, direction: str) -> str:
+        """External statistic id of the interface speed."""
+        return f"{DOMAIN}:{slugify(self.config_entry.unique_id)}_" \
+               f"{slugify(interface)}_{direction}"
+
+
+    async def async_import(self, _now: datetime.datetime | None = None) -> None:
+        """Import complete hours missing in long-term statistics."""
+        if "recorder" not in self.hass.config.components:
+            return
+
+        series = [
+            (interface, direction)
+            for interface in self._interfaces()
+            for direction in RRD_DIRECTIONS
+        ]
+        if not series:
+            return
+
+        now = dt_util.utcnow()
+        last_imported = {
+            key: await self._async_last_imported(self.statistic_id(*key))
+            for key in series
+        }
+
+        # The shortest span covering the largest gap
+        oldest = min(
+            (start for start in last_imported.values() if start), default=None)
+        gap = now - oldest if oldest else max(RRD_DETAIL_SPANS.values())
+        detail = next(
+            (detail for detail, span in RRD_DETAIL_SPANS.items() if gap <= span),
+            max(RRD_DETAIL_SPANS)
+        )
+
+        try:
+            results = await self._fetch([
+                RCICommand(RCI_INTERFACE_RRD, {
+                    "name": interface, "attribute": direction, "detail": detail
+                }) for interface, direction in series
+            ])
+        except (UpdateFailed, HomeAssistantError) as ex:
+            _LOGGER.debug("%s: failed to fetch RRD history: %s",
+                          self.config_entry.title, ex)
+            return
+
+        for (interface, direction), result in zip(series, results, strict=True):
+            try:
+                hourly = make_hourly_statistics(
+                    result["data"], RRD_DETAIL_STEPS[detail],
+                    last_imported[(interface, direction)], now)
+            except (KeyError, TypeError, ValueError) as ex:
+                _LOGGER.debug("%s: unexpected %s %s RRD data: %s",
+                              self.config_entry.title, interface, direction, ex)
+                continue
+
+            if hourly:
+                async_add_external_statistics(
+                    self.hass,
+                    self._make_metadata(interface, direction),
+                    hourly
+                )
+
+
+    async def _async_last_imported(
+            self,
+            statistic_id: str
+    ) -> datetime.datetime | None:
+        last = await get_instance(self.hass).async_add_executor_job(
+            get_last_statistics, self.hass, 1, statistic_id, True, {"mean"}
+        )
+        if rows := last.get(statistic_id):
+            return dt_util.utc_from_timestamp(rows[0]["start"])
+        return None
+
+
+    def _make_metadata(self, interface: str, direction: str) -> StatisticMetaData:
+        return StatisticMetaData(
+            has_mean=True,
+            has_sum=False,
+            name=f"{self.config_entry.title} {interface} "
+                 f"{'RX' if direction == 'rxspeed' else 'TX'} speed",
+            source=DOMAIN,
+            statistic_id=self.statistic_id(interface, direction),
+            unit_of_measurement=UnitOfDataRate.BITS_PER_SECOND
+        )
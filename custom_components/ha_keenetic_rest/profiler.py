@@ -0,0 +1,124 @@
+"""Refresh cycles profiler."""
+
+from collections import defaultdict
+from collections.abc import Callable
+import cProfile
+import json
+import logging
+import statistics
+
+_LOGGER = logging.getLogger(__name__)
+
+# Refresh cycle phases:
+# - fetch: waiting for the router response;
+# - decode: JSON decoding of responses;
+# - process: topics data processing (clients store, rates);
+# - listener: network clients listener;
+# - entity_writes: coordinators' entities updates.
+PHASES = ("fetch", "decode", "process", "listener", "entity_writes")
+
+
+class RefreshProfiler:
+    """Profile the next refresh cycles of a router.
+
+    The event loop is profiled with cProfile during every cycle, phase
+    timings are collected by the scheduler and the router while the
+    profiler is attached. Nothing is measured while it is not attached.
+    """
+
+    def __init__(  # noqa: D107
+        self,
+        cycles: int,
+        decode_time: Callable[[], float],
+        on_done: Callable[["RefreshProfiler"], None]
+    ) -> None:
+        self.cycles = cycles
+        self.timings: list[dict[str, float]] = []
+
+        self._decode_time = decode_time
+        self._on_done = on_done
+        self._profile = cProfile.Profile()
+        self._profiling = False
+        self._cycle: dict[str, float] | None = None
+        self._cycle_decode_time = 0.0
+
+
+    @property
+    def done(self) -> bool:
+        """Whether all cycles are profiled."""
+        return len(self.timings) >= self.cycles
+
+
+    def start_cycle(self) -> None:
+        """Start refresh cycle."""
+        self._cycle = defaultdict(float)
+        self._cycle_decode_time = self._decode_time()
+        try:
+            self._profile.enable()
+            self._profiling = True
+        except ValueError as ex:
+            # Another profiler is active, collect phase timings only
+            _LOGGER.warning("Refresh profiling is unavailable: %s", ex)
+
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Add time spent in the phase during the current cycle."""
+        if self._cycle is not None:
+            self._cycle[phase] += seconds
+
+
+    def end_cycle(self) -> None:
+        """Finish refresh cycle, call on_done after the last one."""
+        self.cancel()
+        cycle, self._cycle = self._cycle, None
+        if cycle is None:
+            return
+
+        # Fetch time includes decoding, dispatch includes the listener
+        cycle["decode"] = self._decode_time() - self._cycle_decode_time
+        cycle["fetch"] = max(cycle["fetch"] - cycle["decode"], 0)
+        cycle["entity_writes"] = max(
+            cycle.pop("dispatch", 0) - cycle["listener"], 0)
+
+        self.timings.append({
+            phase: round(cycle[phase] * 1000, 3) for phase in PHASES
+        })
+        if self.done:
+            self._on_done(self)
+
+
+    def cancel(self) -> None:
+        """Stop profiling the current cycle."""
+        if self._profiling:
+            self._profile.disable()
+            self._profiling = False
+
+
+    def summary(self) -> dict:
+        """Per-phase timings summary, ms."""
+        return {
+            "cycles": len(self.timings),
+            "phases": {
+                phase: {
+                    "mean": round(statistics.fmean(
+                        cycle[phase] for cycle in self.timings), 3),
+                    "max": max(cycle[phase] for cycle in self.timings),
+                    "total": round(sum(
+                        cycle[phase] for cycle in self.timings), 3)
+                } for phase in PHASES
+            } if self.timings else {},
+            "timings": self.timings
+        }
+
+
+    def write(self, path: str) -> tuple[str, str]:
+        """Write cProfile stats and timings summary files.
+
+        Makes blocking I/O, returns the files paths.
+        """
+        profile_path = f"{path}.prof"
+        timings_path = f"{path}.json"
+        self._profile.dump_stats(profile_path)
+        with open(timings_path, "w", encoding="utf-8") as file:
+            json.dump(self.summary(), file, indent=4)
+        return profile_path, timings_path
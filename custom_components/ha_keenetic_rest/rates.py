@@ -0,0 +1,141 @@
+"""Network clients traffic rates."""
+
+import heapq
+from operator import itemgetter
+from typing import Any
+
+COUNTER_32_MAX = 2 ** 32
+
+# Shorter intervals (e.g. refresh after a switch toggle) keep previous rates,
+# as router counters are not updated often enough to be accurate
+MIN_RATE_INTERVAL = 5.0
+
+# Hotspot byte counter -> rate key
+RATE_COUNTERS = {
+    "rxspeed": "rxbytes",
+    "txspeed": "txbytes",
+}
+
+
+def counter_delta(
+    previous: int,
+    current: int,
+    max_delta: float | None = None
+) -> int:
+    """Bytes transferred between two counter readings.
+
+    A decreased counter is either a 32-bit counter wraparound or a counter
+    reset, e.g. after the client reconnected. In the latter case the
+    current reading is the amount transferred since the reset.
+
+    Wraparound is assumed only if the previous reading was in the upper
+    half of the range and the wrapped delta is at most max_delta, the
+    amount the link could transfer. Without max_delta a decrease is always
+    a reset, as the counters width is not known.
+    """
+    if current >= previous:
+        return current - previous
+    if max_delta is not None and COUNTER_32_MAX // 2 <= previous < COUNTER_32_MAX:
+        wrapped = current + COUNTER_32_MAX - previous
+        if wrapped <= max_delta:
+            return wrapped
+    return current
+
+
+def link_max_bytes(speed: Any, interval: float) -> float | None:
+    """Bytes a link of the speed (Mbit/s) can transfer in the interval."""
+    if isinstance(speed, bool) or not isinstance(speed, int | float) \
+            or speed <= 0:
+        return None
+    return speed * 1_000_000 / 8 * interval
+
+
+def top_rates(
+    rates: dict[str, dict[str, int | None]],
+    rate_key: str,
+    count: int
+) -> list[tuple[str, int]]:
+    """Clients with the highest non-zero rate, highest first.
+
+    Partial selection with a heap of count elements.
+    """
+    return heapq.nlargest(
+        count,
+        (
+            (client_id, client_rates[rate_key])
+            for client_id, client_rates in rates.items()
+            if client_rates.get(rate_key)
+        ),
+        key=itemgetter(1)
+    )
+
+
+class ClientRateEngine:
+    """Compute Network clients RX/TX rates (bits/s) from byte counters.
+
+    Rates are calculated from counter deltas between consecutive
+    "show ip hotspot" snapshots.
+    """
+
+    def __init__(self) -> None:  # noqa: D107
+        self.rates: dict[str, dict[str, int | None]] = {}
+        self._counters: dict[str, dict[str, int]] = {}
+        self._timestamp: float | None = None
+
+
+    def update(self, clients: dict, timestamp: float) -> dict[str, set]:
+        """Update rates with the new network clients snapshot.
+
+        Returns changed rate keys of every client with changed rates.
+        """
+        if self._timestamp is not None and \
+                timestamp - self._timestamp < MIN_RATE_INTERVAL:
+            return {}
+
+        interval = None
+        if self._timestamp is not None:
+            interval = timestamp - self._timestamp
+        counters = {}
+        rates = {}
+        for client_id, client in clients.items():
+            counters[client_id] = {
+                counter: client[counter]
+                for counter in RATE_COUNTERS.values()
+                if isinstance(client.get(counter), int)
+            }
+            previous = self._counters.get(client_id, {})
+
+            rates[client_id] = {}
+            for rate_key, counter in RATE_COUNTERS.items():
+                if counter not in counters[client_id] or counter not in previous \
+                        or interval is None:
+                    rates[client_id][rate_key] = None
+                    continue
+
+                delta = counter_delta(
+                    previous[counter], counters[client_id][counter],
+                    link_max_bytes(client.get("speed"), interval))
+                rates[client_id][rate_key] = round(delta * 8 / interval)
+
+        changes = {}
+        for client_id, client_rates in rates.items():
+            previous = self.rates.get(client_id, {})
+            if keys := {key for key, rate in client_rates.items()
+                        if previous.get(key) != rate}:
+                changes[client_id] = keys
+
+        self._counters = counters
+        self._timestamp = timestamp
+        self.rates = rates
+        return changes
+
+
+    @property
+    def timestamp(self) -> float | None:
+        """Timestamp of the snapshot the rates are calculated with."""
+        return self._timestamp
+
+
+    def get_rate(self, client_id: str, rate_key: str) -> int | None:
+        """Get client rate ("rxspeed", "txspeed") in bits/s."""
+        return self.rates.get(client_id, {}).get(rate_key)
@@ -4,6 +4,7 @@ import asyncio
 import datetime
 from functools import partial
 import logging
+import time
 
 import aiohttp
 
@@ -17,38 +18,196 @@ from homeassistant.const import (
     CONF_USERNAME,
     #    CONF_VERIFY_SSL,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, HomeAssistantError
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import async_dispatcher_send
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import (
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
 
-from .api import KeeneticAPI
+from .api import (
+    RCI_BATCH_URL,
+    RCI_INTERFACE_STATS,
+    RCI_INTERFACES,
+    RCI_INTERNET_STATUS,
+    RCI_NETWORK_CLIENTS,
+    RCI_SYSTEM_FW,
+    RCI_SYSTEM_STATS,
+    KeeneticAPI,
+    KeeneticRCIError,
+    RCICommand,
+    make_client_access_command,
+    make_client_registered_command,
+)
 from .const import (
+    CONF_INTERFACES,
+    CONF_MAX_POLL_INTERVAL,
+    CONF_MIN_POLL_INTERVAL,
+    CONF_SPEED_STATISTICS,
+    CONF_SYSLOG_PORT,
+    CONF_TOP_TALKERS,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
+    DEFAULT_TOP_TALKERS,
     DOMAIN,
     PROTOCOL_HTTP,
+    RCI_CACHE_TTL,
+    RCI_WRITE_WINDOW,
     SIGNAL_NEW_NETWORK_CLIENTS,
+    SNAPSHOT_SAVE_DELAY,
+    STORAGE_VERSION,
     UPDATE_COORDINATOR_CLIENTS,
-    UPDATE_COORDINATOR_CLIENTS_RX_SPEED,
-    UPDATE_COORDINATOR_CLIENTS_TX_SPEED,
+    UPDATE_COORDINATOR_DIAGNOSTICS,
     UPDATE_COORDINATOR_IF_STATS,
+    UPDATE_COORDINATOR_INTERFACES,
     UPDATE_COORDINATOR_INTERNET_STATUS,
     UPDATE_COORDINATOR_SYS_FW,
     UPDATE_COORDINATOR_SYS_STATS,
 )
+from .breaker import STATE_CLOSED, CircuitBreaker, CircuitOpenError, backoff_delay
+from .clients import NetworkClientStore
+from .coordinator import NetworkClientsCoordinator
+from .fleet import KeeneticFleet
+from .history import RRDStatisticsImporter
+from .profiler import RefreshProfiler
+from .rates import RATE_COUNTERS, ClientRateEngine, top_rates
+from .scheduler import KeeneticPollScheduler
+from .syslog import KeeneticSyslogListener
+from .telemetry import ClientSpeedHistory
+from .writer import RCIWriteQueue
 
 _LOGGER = logging.getLogger(__name__)
 
 
+# Network client data fields used for the client device name
+CLIENT_NAME_FIELDS = frozenset(("mac", "hostname", "name"))
+
 UPDATE_INTERVALS = {
     UPDATE_COORDINATOR_SYS_FW: datetime.timedelta(minutes=60),
     UPDATE_COORDINATOR_SYS_STATS: datetime.timedelta(seconds=30),
     UPDATE_COORDINATOR_INTERNET_STATUS: datetime.timedelta(seconds=30),
     UPDATE_COORDINATOR_CLIENTS: datetime.timedelta(seconds=30),
-    UPDATE_COORDINATOR_CLIENTS_RX_SPEED: datetime.timedelta(seconds=30),
-    UPDATE_COORDINATOR_CLIENTS_TX_SPEED: datetime.timedelta(seconds=30)
+    UPDATE_COORDINATOR_IF_STATS: datetime.timedelta(seconds=30),
+    UPDATE_COORDINATOR_INTERFACES: datetime.timedelta(minutes=60)
 }
 
+# Topics needed to create entities are fetched during setup, the rest
+# is loaded right after it
+STARTUP_TOPICS = (
+    UPDATE_COORDINATOR_CLIENTS,
+    UPDATE_COORDINATOR_INTERNET_STATUS,
+)
+DEFERRED_TOPICS = (
+    UPDATE_COORDINATOR_SYS_STATS,
+    UPDATE_COORDINATOR_IF_STATS,
+    UPDATE_COORDINATOR_SYS_FW,
+    UPDATE_COORDINATOR_INTERFACES,
+)
+
+# Network clients poll interval for presence reconciliation while presence
+# is pushed by the router syslog
+SYSLOG_CLIENTS_INTERVAL = datetime.timedelta(seconds=120)
+
+# Interfaces speed RRD history import into long-term statistics
+RRD_IMPORT_INTERVAL = datetime.timedelta(hours=1)
+
+# Frequently changing Network client fields not worth saving the snapshot
+SNAPSHOT_SKIP_FIELDS = frozenset(("rxbytes", "txbytes", "rxspeed", "txspeed",
+                                  "rssi"))
+
+
+# Connection errors retries and circuit breaker
+RETRY_ATTEMPTS = 2
+RETRY_BACKOFF = 0.5
+RETRY_BACKOFF_MAX = 3.0
+# Connection establishment failures, the request was not sent. Requests
+# timed out or broken after sending are not retried, a hung router would
+# block polls for several total timeouts
+RETRY_ERRORS = (aiohttp.ClientConnectorError, aiohttp.ConnectionTimeoutError)
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_RESET_TIMEOUT = 30
+
+# Router load thresholds for adaptive polling
+HIGH_CPU_LOAD = 80
+LOW_CPU_LOAD = 50
+HIGH_LATENCY = 5.0
+LOW_LATENCY = 1.0
+# Presence changes per clients poll to poll clients more often
+BUSY_PRESENCE_CHANGES = 3
+
+LOAD_FACTOR_STEP = 2.0
+LOAD_FACTOR_DECAY = 0.75
+CLIENTS_FACTOR_STEP = 0.5
+CLIENTS_FACTOR_DECAY = 1.5
+
+
+class AdaptivePollController:
+    """Adjust poll intervals to router load and clients activity.
+
+    Intervals are lengthened while the router CPU load or request latency
+    is high and are restored when the router is idle. Network clients are
+    polled more often while presence changes happen often. Intervals are
+    kept within bounds; topics with base interval above the upper bound
+    are never polled less often than by their base interval.
+    """
+
+    def __init__(  # noqa: D107
+        self,
+        base_intervals: dict[str, datetime.timedelta],
+        min_interval: datetime.timedelta,
+        max_interval: datetime.timedelta
+    ) -> None:
+        self.base_intervals = base_intervals
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.load_factor = 1.0
+        self.clients_factor = 1.0
+
+
+    def update(
+            self,
+            cpuload: float | None,
+            latency: float,
+            presence_changes: int
+    ) -> None:
+        """Update factors with the latest poll results."""
+        max_factor = self.max_interval / min(self.base_intervals.values())
+        min_factor = self.min_interval / \
+            self.base_intervals[UPDATE_COORDINATOR_CLIENTS]
+
+        cpuload = cpuload or 0
+        if cpuload >= HIGH_CPU_LOAD or latency >= HIGH_LATENCY:
+            self.load_factor = min(self.load_factor * LOAD_FACTOR_STEP,
+                                   max(max_factor, 1.0))
+        elif cpuload <= LOW_CPU_LOAD and latency <= LOW_LATENCY:
+            self.load_factor = max(self.load_factor * LOAD_FACTOR_DECAY, 1.0)
+
+        if presence_changes >= BUSY_PRESENCE_CHANGES:
+            self.clients_factor = max(
+                self.clients_factor * CLIENTS_FACTOR_STEP, min(min_factor, 1.0))
+        elif presence_changes == 0:
+            self.clients_factor = min(
+                self.clients_factor * CLIENTS_FACTOR_DECAY, 1.0)
+
+
+    def intervals(self) -> dict[str, datetime.timedelta]:
+        """Get current topics intervals."""
+        intervals = {}
+        for topic, base in self.base_intervals.items():
+            factor = self.load_factor
+            if topic == UPDATE_COORDINATOR_CLIENTS:
+                factor *= self.clients_factor
+
+            interval = datetime.timedelta(
+                seconds=round((base * factor).total_seconds()))
+            intervals[topic] = min(max(interval, self.min_interval),
+                                   max(self.max_interval, base))
+        return intervals
+
 
 class KeeneticAuthFailed(HomeAssistantError):
     """Keenetic authentication error."""
@@ -64,87 +223,309 @@ class KeeneticAuthFailed(HomeAssistantError):
 class KeeneticRouter:
     """Representation of Keenetic router."""
 
-    def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:  # noqa: D107
+    def __init__(  # noqa: D107
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        fleet: KeeneticFleet | None = None
+    ) -> None:
         self.hass = hass
         self.config_entry = config_entry
+        self.fleet = fleet
         self.update_coordinators = {}
         self.tracked_network_client_ids = []
         self.wan_interface_name = None
+        # Interfaces with rate and status sensors
+        self.selected_interfaces: list[str] = list(
+            config_entry.options.get(CONF_INTERFACES, []))
+        self.client_store = NetworkClientStore()
+        self.client_rates = ClientRateEngine()
+        self.client_history = ClientSpeedHistory()
+        # Rate key -> clients with the highest rates
+        self.top_talkers: dict[str, list[dict]] = {}
 
         self._authenticated = False
-        self._device_ids = {}
+        self._auth_lock = asyncio.Lock()
+        self._breaker = CircuitBreaker(
+            failure_threshold=CIRCUIT_FAILURE_THRESHOLD,
+            reset_timeout=CIRCUIT_RESET_TIMEOUT
+        )
+        self._auth_generation = 0
+        # Network client MAC -> (device id, device name)
+        self._device_ids: dict[str, tuple[str, str | None]] = {}
 
         self.api = KeeneticAPI(
             scheme=PROTOCOL_HTTP, #config_entry.data[CONF_PROTOCOL],
             host=config_entry.data[CONF_HOST],
             port=config_entry.data[CONF_PORT],
-            ssl_validation=False #config_entry.data[CONF_VERIFY_SSL]
+            ssl_validation=False, #config_entry.data[CONF_VERIFY_SSL]
+            cache_ttl=RCI_CACHE_TTL,
+            connector=fleet.connector if fleet else None,
+            budget=fleet.budget if fleet else None
+        )
+        self.scheduler = KeeneticPollScheduler(
+            hass=hass,
+            config_entry=config_entry,
+            fetch=self._fetch_batch,
+            on_poll=self._on_poll
+        )
+        # Settings changes, e.g. switch toggles, sent in batches
+        self.write_queue = RCIWriteQueue(
+            send=self._fetch_batch,
+            on_sent=self._writes_sent,
+            window=RCI_WRITE_WINDOW
+        )
+        # Presence pushed with syslog, network clients poll only reconciles it
+        self.syslog_listener = None
+        self.update_intervals = dict(UPDATE_INTERVALS)
+        if syslog_port := config_entry.options.get(CONF_SYSLOG_PORT):
+            self.syslog_listener = KeeneticSyslogListener(
+                router_host=config_entry.data[CONF_HOST],
+                port=syslog_port,
+                on_presence=self._syslog_presence_listener
+            )
+            self.update_intervals[UPDATE_COORDINATOR_CLIENTS] = \
+                SYSLOG_CLIENTS_INTERVAL
+
+        self.poll_controller = AdaptivePollController(
+            base_intervals=self.update_intervals,
+            min_interval=datetime.timedelta(seconds=config_entry.options.get(
+                CONF_MIN_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL)),
+            max_interval=datetime.timedelta(seconds=config_entry.options.get(
+                CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL))
+        )
+        self._presence_changes = 0
+        self.last_poll_latency: float | None = None
+        # Last known router data for warm start
+        self._snapshot_store: Store[dict] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{config_entry.entry_id}"
+        )
+        self.history_importer = RRDStatisticsImporter(
+            hass=hass,
+            config_entry=config_entry,
+            fetch=self._fetch_batch,
+            interfaces=self._get_polled_interfaces
         )
 
 
     async def async_setup(self) -> None:
-        """Create update coordinators to fetch data using Keenetic api."""
-        await self._auth()
-
-        # General update coordinators
-        update_methods = {
-            UPDATE_COORDINATOR_SYS_FW: partial(self._fetch_data,
-                                           self.api.get_system_fw),
-            UPDATE_COORDINATOR_INTERNET_STATUS: partial(self._fetch_data,
-                                                        self.api.get_internet_status),
-            UPDATE_COORDINATOR_CLIENTS: partial(self._fetch_data,
-                                                self.api.get_network_clients),
-            UPDATE_COORDINATOR_SYS_STATS: self._get_system_stats,
-            UPDATE_COORDINATOR_CLIENTS_RX_SPEED: self._get_network_clients_rx,
-            UPDATE_COORDINATOR_CLIENTS_TX_SPEED: self._get_network_clients_tx
-        }
-
-        for coordinator_type, method in update_methods.items():
-            self.update_coordinators[coordinator_type] = DataUpdateCoordinator(
-                self.hass, _LOGGER,
-                name=f"{coordinator_type}",
-                update_method=method,
-                update_interval=UPDATE_INTERVALS[coordinator_type]
+        """Create update coordinators to fetch data using Keenetic api.
+
+        If the last known snapshot is available, entities are created from it
+        without waiting for the router, live data is fetched after setup.
+        """
+        self._add_poll_topics()
+
+        snapshot = await self._snapshot_store.async_load()
+        if snapshot and self._restore_snapshot(snapshot):
+            refresh_topics = [*STARTUP_TOPICS, *DEFERRED_TOPICS]
+            if snapshot.get("firmware"):
+                # Firmware info rarely changes, it is polled on schedule
+                refresh_topics.remove(UPDATE_COORDINATOR_SYS_FW)
+                self.scheduler.postpone([UPDATE_COORDINATOR_SYS_FW])
+        else:
+            await self._auth()
+
+            # Entities are created as soon as presence data is available
+            await self.scheduler.async_first_refresh(list(STARTUP_TOPICS))
+
+            self.tracked_network_client_ids = list(
+                self.get_network_clients_data().keys()
             )
-            await self.update_coordinators[coordinator_type].\
-                async_config_entry_first_refresh()
+            self._update_wan_interface_name()
+            refresh_topics = list(DEFERRED_TOPICS)
 
-        self.tracked_network_client_ids = list(
-            self.get_network_clients_data().keys()
+        # Add coordinators' listeners
+        ## Network clients listener
+        self.config_entry.async_on_unload(
+            self.update_coordinators[UPDATE_COORDINATOR_CLIENTS].\
+                async_add_listener(self._network_clients_listener)
         )
 
-        # Get WAN interface name
-        self.wan_interface_name = \
+        ## WAN interface name
+        self.config_entry.async_on_unload(
             self.update_coordinators[UPDATE_COORDINATOR_INTERNET_STATUS].\
-                data.get("gateway", {}).get("interface")
+                async_add_listener(self._update_wan_interface_name)
+        )
 
-        # Interfaces stats update coordinator
-        self.update_coordinators[UPDATE_COORDINATOR_IF_STATS] = \
+        ## Router device firmware info
+        self.config_entry.async_on_unload(
+            self.update_coordinators[UPDATE_COORDINATOR_SYS_FW].\
+                async_add_listener(self._firmware_listener)
+        )
+
+        ## Network client devices index
+        self._load_device_ids()
+        self._update_client_device_names(self.tracked_network_client_ids)
+        self.config_entry.async_on_unload(
+            self.hass.bus.async_listen(dr.EVENT_DEVICE_REGISTRY_UPDATED,
+                                       self._device_registry_listener)
+        )
+
+        ## Requests statistics, updated after every scheduled poll
+        self.update_coordinators[UPDATE_COORDINATOR_DIAGNOSTICS] = \
             DataUpdateCoordinator(
                 self.hass, _LOGGER,
-                name=UPDATE_COORDINATOR_IF_STATS,
-                update_method=partial(self._get_interface_stats,
-                                      names=[self.wan_interface_name]),
-                update_interval=datetime.timedelta(seconds=30)
+                name=UPDATE_COORDINATOR_DIAGNOSTICS,
+                update_method=self._async_get_request_stats
             )
-        await self.update_coordinators[UPDATE_COORDINATOR_IF_STATS].\
-            async_config_entry_first_refresh()
+        self.update_coordinators[UPDATE_COORDINATOR_DIAGNOSTICS].\
+            async_set_updated_data(self.get_request_stats())
 
-        # Add coordinators' listeners
-        ## Network clients listener
+        # Routers of the fleet poll at different moments
+        self.scheduler.start(
+            phase=self.fleet.register(self.config_entry.entry_id)
+                if self.fleet else 0
+        )
+        self.config_entry.async_on_unload(self.close)
+
+        ## Network clients presence from syslog
+        if self.syslog_listener:
+            await self._start_syslog_listener()
+
+        ## Interfaces speed history
         self.config_entry.async_on_unload(
-            self.update_coordinators[UPDATE_COORDINATOR_CLIENTS].\
-                async_add_listener(self._network_clients_listener)
+            async_track_time_interval(
+                self.hass, self.history_importer.async_import,
+                RRD_IMPORT_INTERVAL,
+                name=f"{self.config_entry.title} RRD history import"
+            )
+        )
+
+        # Data not fetched during setup is loaded with one batch after it,
+        # then history missed while Home Assistant was down is imported
+        self.config_entry.async_create_background_task(
+            self.hass, self._async_deferred_refresh(refresh_topics),
+            f"{self.config_entry.title} deferred refresh"
         )
 
-        self.config_entry.async_on_unload(self.close)
+
+    async def _async_deferred_refresh(self, topics: list[str]) -> None:
+        # Routers of the fleet set up together do not refresh together
+        await asyncio.sleep(self.scheduler.phase_delay())
+        await self.scheduler.async_refresh(topics)
+        await self.history_importer.async_import()
+
+
+    def _add_poll_topics(self) -> None:
+        """Add poll topics and their update coordinators."""
+        poll_topics = {
+            UPDATE_COORDINATOR_SYS_FW: (
+                partial(self._make_commands, RCI_SYSTEM_FW),
+                self._process_single_result
+            ),
+            UPDATE_COORDINATOR_SYS_STATS: (
+                partial(self._make_commands, RCI_SYSTEM_STATS),
+                self._process_system_stats
+            ),
+            UPDATE_COORDINATOR_INTERNET_STATUS: (
+                partial(self._make_commands, RCI_INTERNET_STATUS),
+                self._process_single_result
+            ),
+            UPDATE_COORDINATOR_CLIENTS: (
+                partial(self._make_commands, RCI_NETWORK_CLIENTS),
+                self._process_network_clients
+            ),
+            UPDATE_COORDINATOR_IF_STATS: (
+                self._make_interface_stats_commands,
+                self._process_interface_stats
+            ),
+            UPDATE_COORDINATOR_INTERFACES: (
+                partial(self._make_commands, RCI_INTERFACES),
+                self._process_interfaces
+            )
+        }
+
+        # Network clients entities are notified only about their changes
+        coordinator_kwargs = {
+            UPDATE_COORDINATOR_CLIENTS: {
+                "coordinator_class": NetworkClientsCoordinator,
+                "pop_changes": self.client_store.pop_changes,
+                # Rates depend on the time between polls
+                "skip_unchanged": False
+            },
+            # A failed selected interface does not fail the WAN statistics
+            UPDATE_COORDINATOR_IF_STATS: {
+                "partial_results": True
+            }
+        }
+
+        for topic, (commands, process) in poll_topics.items():
+            self.update_coordinators[topic] = self.scheduler.add_topic(
+                name=topic,
+                interval=self.update_intervals[topic],
+                commands=commands,
+                process=process,
+                **coordinator_kwargs.get(topic, {})
+            )
 
 
     async def close(self) -> None:
-        """Close session."""
+        """Stop polling, save the snapshot and close session."""
+        self.scheduler.stop()
+        self.write_queue.cancel()
+        if self.syslog_listener:
+            self.syslog_listener.stop()
+        if self.fleet:
+            self.fleet.unregister(self.config_entry.entry_id)
+        if self.get_network_clients_data() is not None:
+            await self._snapshot_store.async_save(self._make_snapshot())
         await self.api.close()
 
 
+    def _make_snapshot(self) -> dict:
+        """Make the last known router data snapshot."""
+        return {
+            "clients": {
+                client_id: client.as_dict()
+                for client_id, client in self.get_network_clients_data().items()
+            },
+            "firmware": self.update_coordinators[UPDATE_COORDINATOR_SYS_FW].data,
+            "wan_interface_name": self.wan_interface_name,
+            "tracked_network_client_ids": self.tracked_network_client_ids
+        }
+
+
+    def _restore_snapshot(self, snapshot: dict) -> bool:
+        """Restore coordinators data from the snapshot.
+
+        Restored data is replaced with live data on the first poll.
+        """
+        try:
+            tracked_network_client_ids = list(
+                snapshot["tracked_network_client_ids"])
+            self.client_store.update(list(snapshot["clients"].values()))
+        except (AttributeError, KeyError, TypeError) as ex:
+            _LOGGER.warning("%s: ignoring invalid snapshot: %s",
+                            self.config_entry.title, ex)
+            self.client_store.update([])
+            self.client_store.pop_changes()
+            return False
+
+        # Live data is compared with the restored one
+        self.client_store.pop_changes()
+        self.update_coordinators[UPDATE_COORDINATOR_CLIENTS].data = \
+            self.client_store.clients
+        self.update_coordinators[UPDATE_COORDINATOR_SYS_FW].data = \
+            snapshot.get("firmware")
+        self.tracked_network_client_ids = tracked_network_client_ids
+        self.wan_interface_name = snapshot.get("wan_interface_name")
+        return True
+
+
+    @callback
+    def _save_snapshot(self) -> None:
+        self._snapshot_store.async_delay_save(self._make_snapshot,
+                                              SNAPSHOT_SAVE_DELAY)
+
+
+    @callback
+    def _update_wan_interface_name(self) -> None:
+        data = self.update_coordinators[UPDATE_COORDINATOR_INTERNET_STATUS].data
+        if data and (name := data.get("gateway", {}).get("interface")):
+            self.wan_interface_name = name
+
+
     async def _auth(self) -> None:
         """Authenticate."""
         auth_ok = await self.api.auth(
@@ -158,44 +539,188 @@ class KeeneticRouter:
         self._authenticated = True
 
 
-    async def _fetch_data(self, api_func: callable,
-                        try_auth: bool = False, **kwargs) -> dict:
+    async def _reauth(self, generation: int) -> None:
+        """Authenticate once for all concurrent requests.
+
+        Requests which failed with the session of the same generation wait
+        for a single authentication attempt.
+        """
+        async with self._auth_lock:
+            if generation != self._auth_generation:
+                # Already re-authenticated by another request
+                return
+
+            self._authenticated = False
+            try:
+                await self._auth()
+            except KeeneticAuthFailed:
+                raise ConfigEntryAuthFailed(  # noqa: B904
+                    f"Credentials expired for {self.config_entry.data[CONF_NAME]}"
+                )
+            self._auth_generation += 1
+
+
+    async def _request(self, api_func: callable, **kwargs) -> dict:
+        """Call API function, re-authenticate if session expired."""
+        if not self._authenticated:
+            await self._reauth(self._auth_generation)
+
+        generation = self._auth_generation
         try:
-            if not self._authenticated and try_auth:
-                try:
-                    await self._auth()
-                except KeeneticAuthFailed:
-                    raise ConfigEntryAuthFailed(  # noqa: B904
-                        f"Credentials expired for {self.config_entry.data[CONF_NAME]}"
-                    )
+            return await api_func(**kwargs)
+        except aiohttp.ClientResponseError as ex:
+            if ex.status != 401:
+                raise
+
+        # Unauthorized: session expired, retry with the new session
+        await self._reauth(generation)
+        return await api_func(**kwargs)
 
-            if self._authenticated:
-                return await api_func(**kwargs)
 
+    async def _fetch_data(self, api_func: callable, **kwargs) -> dict:
+        try:
+            self._breaker.before_request()
+        except CircuitOpenError as ex:
             raise UpdateFailed(
                 f"Failed to fetch data from "
-                f"{self.api.base_url} ({self.config_entry.data[CONF_NAME]}). Unauthorized."
-            )
-        except (aiohttp.ClientConnectorError, TimeoutError) as ex:
+                f"{self.api.base_url} ({self.config_entry.data[CONF_NAME]}): {ex}"
+            ) from ex
+
+        attempt = 0
+        try:
+            while True:
+                try:
+                    result = await self._request(api_func, **kwargs)
+                except (aiohttp.ClientConnectionError, TimeoutError) as ex:
+                    # Retry only while the router was available
+                    if not isinstance(ex, RETRY_ERRORS) or \
+                            attempt >= RETRY_ATTEMPTS or \
+                            self._breaker.state != STATE_CLOSED:
+                        self._breaker.record_failure()
+                        raise
+                    await asyncio.sleep(
+                        backoff_delay(attempt, RETRY_BACKOFF, RETRY_BACKOFF_MAX))
+                    attempt += 1
+                    continue
+
+                self._breaker.record_success()
+                return result
+        except (aiohttp.ClientConnectionError, TimeoutError) as ex:
             # Connection error
             raise UpdateFailed(
                 f"Failed to fetch data from "
                 f"{self.api.base_url} ({self.config_entry.data[CONF_NAME]}): {ex}"
             ) from ex
         except aiohttp.ClientResponseError as ex:
+            # Router is available, but request failed
+            self._breaker.record_success()
             if ex.status == 401:
-                # Unauthorized
+                # Unauthorized after re-authentication
                 self._authenticated = False
 
             raise UpdateFailed(
                 f"Failed to fetch data from "
                 f"{self.api.base_url} ({self.config_entry.data[CONF_NAME]}): {ex}"
             ) from ex
+        except KeeneticRCIError as ex:
+            # Command failed, other commands of the batch are not affected
+            self._breaker.record_success()
+            raise UpdateFailed(
+                f"Failed to fetch data from "
+                f"{self.api.base_url} ({self.config_entry.data[CONF_NAME]}): {ex}"
+            ) from ex
+        except (aiohttp.ClientError, ValueError) as ex:
+            # Broken (e.g. truncated payload) or malformed response
+            self._breaker.record_failure()
+            raise UpdateFailed(
+                f"Failed to fetch data from "
+                f"{self.api.base_url} ({self.config_entry.data[CONF_NAME]}): {ex}"
+            ) from ex
+
 
+    async def _fetch_batch(self, commands: list[RCICommand]) -> list:
+        """Fetch RCI commands results with one request."""
+        return await self._fetch_data(self.api.execute_batch,
+                                      commands=commands)
 
-    async def _get_system_stats(self) -> dict:
-        """Fetch Keenetic system statistics."""
-        data = await self._fetch_data(self.api.get_system_stats, try_auth=True)
+
+    def _get_polled_interfaces(self) -> list[str]:
+        """WAN and selected interfaces, the selected ones if they exist."""
+        names = [self.wan_interface_name] if self.wan_interface_name else []
+        inventory = self.update_coordinators[UPDATE_COORDINATOR_INTERFACES].data
+        names.extend(
+            name for name in self.selected_interfaces
+            if name not in names and (inventory is None or name in inventory)
+        )
+        return names
+
+
+    @staticmethod
+    def _make_commands(url: str, params: dict | None = None) -> list:
+        return [RCICommand(url, params)]
+
+
+    def _make_interface_stats_commands(self) -> list:
+        """Status of selected interfaces and statistics of all polled ones.
+
+        All of them are sent as one batch request.
+        """
+        names = self._get_polled_interfaces()
+        return [
+            RCICommand(RCI_INTERFACES, {"name": name})
+            for name in names if name in self.selected_interfaces
+        ] + [
+            RCICommand(RCI_INTERFACE_STATS, {"name": name}) for name in names
+        ]
+
+
+    @staticmethod
+    def _process_single_result(results: list) -> dict:
+        return results[0]
+
+
+    def _process_network_clients(self, results: list) -> dict:
+        self.client_store.update(results[0]["host"])
+        clients = self.client_store.clients
+
+        timestamp = time.monotonic()
+        rate_changes = self.client_rates.update(clients, timestamp)
+        for client_id, rate_keys in rate_changes.items():
+            self.client_store.mark_changed(client_id, rate_keys)
+
+        if self.client_rates.timestamp == timestamp:
+            self.client_history.record(self.client_rates.rates)
+            if self.config_entry.options.get(CONF_SPEED_STATISTICS):
+                # Statistics attributes move with the history window even
+                # if the rate itself is the same
+                for client_id in self.client_rates.rates:
+                    self.client_store.mark_changed(client_id, RATE_COUNTERS)
+            self._update_top_talkers()
+
+        return clients
+
+
+    def _update_top_talkers(self) -> None:
+        count = self.config_entry.options.get(CONF_TOP_TALKERS,
+                                              DEFAULT_TOP_TALKERS)
+        clients = self.client_store.clients
+        self.top_talkers = {
+            rate_key: [
+                {
+                    "mac": client_id,
+                    "name": clients[client_id].name or
+                        clients[client_id].hostname or client_id,
+                    "rate": rate
+                } for client_id, rate in top_rates(
+                    self.client_rates.rates, rate_key, count)
+            ] for rate_key in RATE_COUNTERS
+        }
+
+
+    @staticmethod
+    def _process_system_stats(results: list) -> dict:
+        """Process Keenetic system statistics."""
+        data = results[0]
 
         memory_use = data["memtotal"] - data["memfree"]
         data["memory_usage"] = round(
@@ -205,50 +730,250 @@ class KeeneticRouter:
         return data
 
 
-    async def _get_interface_stats(self, names: list) -> dict:
-        stats = {}
-        async with asyncio.TaskGroup() as tg:
-            for name in names:
-                stats[name] = tg.create_task(
-                    self._fetch_data(self.api.get_interface_stats, name=name))
-        return {name: r.result() for name, r in stats.items()}
+    def _process_interface_stats(self, results: list) -> dict:
+        """Merge status and statistics of every interface by name.
+
+        Interfaces failed to fetch, e.g. removed on the router, are left
+        out, only a failed WAN interface fails the topic.
+        """
+        data = {}
+        failed = set()
+        for command, result in results:
+            name = command.params["name"]
+            if not isinstance(result, Exception):
+                data.setdefault(name, {}).update(result)
+                continue
+            if name == self.wan_interface_name:
+                raise UpdateFailed(
+                    f"Failed to fetch {name} interface statistics: {result}")
+            _LOGGER.debug("%s: failed to fetch %s interface: %s",
+                          self.config_entry.title, name, result)
+            failed.add(name)
+
+        for name in failed:
+            data.pop(name, None)
+        return data
 
 
-    async def _get_network_clients_rx(self) -> dict:
-        """Fetch Network clients RX speed."""
-        return await self._fetch_data(self.api.get_clients_speed,
-                                      direction="rxspeed")
+    @staticmethod
+    def _process_interfaces(results: list) -> dict:
+        """Make interfaces inventory from "show interface" result."""
+        return {
+            name: interface
+            for name, interface in results[0].items()
+            if isinstance(interface, dict)
+        }
 
 
-    async def _get_network_clients_tx(self) -> dict:
-        """Fetch Network clients RX speed."""
-        return await self._fetch_data(self.api.get_clients_speed,
-                                      direction="txspeed")
+    def get_interface_labels(self) -> dict[str, str]:
+        """Get known and selected interfaces names with descriptions."""
+        inventory = self.update_coordinators[UPDATE_COORDINATOR_INTERFACES].\
+            data or {}
+        labels = {}
+        for name, interface in inventory.items():
+            details = [value for value in (interface.get("description"),
+                                           interface.get("type"))
+                       if value and value != name]
+            labels[name] = f"{name} ({', '.join(details)})" if details else name
+        for name in self.selected_interfaces:
+            labels.setdefault(name, name)
+        return labels
 
 
     async def change_client_registered_setting(self, register: bool, mac: str,
                                                name: str | None = None) -> None:
         """Register/Unregister Network client."""
-        await self._fetch_data(
-            self.api.set_client_registered_setting,
-            register=register,
-            mac=mac,
-            name=name
-        )
+        client_id = mac.lower()
+        [result] = await self._async_write_client_settings([(
+            client_id, "registered", register,
+            make_client_registered_command(register, mac, name)
+        )])
+        if isinstance(result, Exception):
+            raise HomeAssistantError(
+                f"Failed to change {client_id} registration: {result}"
+            ) from result
 
 
     async def change_client_internet_access_setting(self, permit: bool,
                                                     mac: str) -> None:
         """Permit/Deny Network client Internet access."""
-        await self._fetch_data(
-            self.api.set_client_internet_access_setting,
-            permit=permit,
-            mac=mac
+        client_id = mac.lower()
+        [result] = await self._async_write_client_settings([(
+            client_id, "access", "permit" if permit else "deny",
+            make_client_access_command(permit, mac)
+        )])
+        if isinstance(result, Exception):
+            raise HomeAssistantError(
+                f"Failed to change {client_id} Internet access: {result}"
+            ) from result
+
+
+    async def async_change_clients_registered(
+            self,
+            client_ids: list[str],
+            register: bool
+    ) -> list:
+        """Register/Unregister Network clients with one write batch.
+
+        Returns None or an exception for every client.
+        """
+        return await self._async_write_client_settings([
+            (
+                client_id, "registered", register,
+                make_client_registered_command(
+                    register, client_id,
+                    self._make_client_device_name(client_id)
+                    if register else None)
+            ) for client_id in client_ids
+        ])
+
+
+    async def async_change_clients_access(
+            self,
+            client_ids: list[str],
+            permit: bool
+    ) -> list:
+        """Permit/Deny Network clients Internet access with one write batch.
+
+        Returns None or an exception for every client.
+        """
+        return await self._async_write_client_settings([
+            (
+                client_id, "access", "permit" if permit else "deny",
+                make_client_access_command(permit, client_id)
+            ) for client_id in client_ids
+        ])
+
+
+    async def _async_write_client_settings(
+            self,
+            changes: list[tuple[str, str, bool | str, RCICommand]]
+    ) -> list:
+        """Queue Network clients settings changes.
+
+        Changes are (client id, field, value, command). The new values are
+        shown optimistically until the clients refresh following the write
+        batch. Returns None or an exception for every change.
+        """
+        changed = False
+        for client_id, field, value, _ in changes:
+            changed |= self.client_store.set_field(client_id, field, value)
+        if changed:
+            self.update_coordinators[
+                UPDATE_COORDINATOR_CLIENTS].async_update_listeners()
+
+        results = await asyncio.gather(
+            *(
+                self.write_queue.write((command.url, client_id), command)
+                for client_id, _, _, command in changes
+            ),
+            return_exceptions=True
         )
+        return [
+            result if isinstance(result, BaseException) else None
+            for result in results
+        ]
+
+
+    def select_clients(
+            self,
+            macs: list[str] | None = None,
+            registered: bool | None = None,
+            active: bool | None = None,
+            segment: str | None = None
+    ) -> list[str]:
+        """Get known Network clients matching all given criteria.
+
+        Segment matches the client interface id, name or description,
+        e.g. "Bridge1" or "Guest".
+        """
+        clients = self.client_store.clients
+        client_ids = [mac.lower() for mac in macs] if macs is not None \
+            else list(clients)
+
+        selected = []
+        for client_id in client_ids:
+            client = clients.get(client_id)
+            if client is None:
+                continue
+            if registered is not None and bool(client.registered) != registered:
+                continue
+            if active is not None and bool(client.active) != active:
+                continue
+            if segment is not None and (
+                    client.interface is None
+                    or not client.interface.matches(segment)):
+                continue
+            selected.append(client_id)
+        return selected
+
+
+    @callback
+    def _writes_sent(self) -> None:
+        """Refresh Network clients once after the write batch."""
+        self.api.clear_cache()
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self.update_coordinators[
+                UPDATE_COORDINATOR_CLIENTS].async_request_refresh(),
+            f"{self.config_entry.title} network clients refresh after write"
+        )
+
+
+    @callback
+    def start_profiling(self, cycles: int) -> None:
+        """Profile the next scheduled refresh cycles.
+
+        Profile and timings files are written to the configuration
+        directory after the last cycle.
+        """
+        if self.scheduler.profiler:
+            raise HomeAssistantError(
+                f"Profiling of {self.config_entry.data[CONF_NAME]} "
+                f"is already running"
+            )
+
+        self.scheduler.profiler = RefreshProfiler(
+            cycles=cycles,
+            # Polls are batch requests, decode times of their commands are
+            # parts of the batch one
+            decode_time=lambda: self.api.endpoint_stats[
+                RCI_BATCH_URL].total_decode_time,
+            on_done=self._profiling_done
+        )
+        _LOGGER.info("%s: profiling the next %s refresh cycles",
+                     self.config_entry.data[CONF_NAME], cycles)
+
+
+    @callback
+    def _profiling_done(self, profiler: RefreshProfiler) -> None:
+        path = self.hass.config.path(
+            f"{DOMAIN}_profile_{self.config_entry.entry_id}_"
+            f"{int(time.time())}"
+        )
+
+        async def _async_write() -> None:
+            files = await self.hass.async_add_executor_job(profiler.write, path)
+            _LOGGER.info("%s: refresh profile written to %s, timings: %s",
+                         self.config_entry.data[CONF_NAME], ", ".join(files),
+                         profiler.summary()["phases"])
+
+        self.config_entry.async_create_background_task(
+            self.hass, _async_write(), "keenetic refresh profile write")
 
 
     @callback
     def _network_clients_listener(self) -> None:
+        if profiler := self.scheduler.profiler:
+            started = time.perf_counter()
+            self._handle_network_clients_update()
+            profiler.add("listener", time.perf_counter() - started)
+        else:
+            self._handle_network_clients_update()
+
+
+    @callback
+    def _handle_network_clients_update(self) -> None:
         data = self.get_network_clients_data()
 
         # New Network client signaling
@@ -261,26 +986,192 @@ class KeeneticRouter:
             async_dispatcher_send(
                 self.hass, SIGNAL_NEW_NETWORK_CLIENTS, new_clients_ids)
 
+        coordinator = self.update_coordinators[UPDATE_COORDINATOR_CLIENTS]
+        changes = coordinator.changes
+
+        # Count presence changes for adaptive polling, not needed while
+        # presence is pushed. Outages and warm starts report every client
+        # changed, they are not network activity
+        if not self.syslog_listener and not coordinator.full_refresh:
+            self._presence_changes += sum(
+                1 for fields in changes.values()
+                if fields is None or "active" in fields
+            )
+
+        # Update Network client device name if its name fields changed
+        self._update_client_device_names([
+            client_id for client_id, fields in changes.items()
+            if fields is None or not fields.isdisjoint(CLIENT_NAME_FIELDS)
+        ])
+
+        if any(fields is None or not fields <= SNAPSHOT_SKIP_FIELDS
+               for fields in changes.values()):
+            self._save_snapshot()
+
+
+    @callback
+    def _on_poll(self, latency: float) -> None:
+        """Handle scheduled poll completion."""
+        self.last_poll_latency = latency
+        self._adapt_poll_intervals(latency)
+        self.update_coordinators[UPDATE_COORDINATOR_DIAGNOSTICS].\
+            async_set_updated_data(self.get_request_stats())
+
+
+    @callback
+    def _firmware_listener(self) -> None:
+        """Update Router device with the fetched firmware info."""
+        if not self.update_coordinators[UPDATE_COORDINATOR_SYS_FW].data:
+            return
+
         device_registry = dr.async_get(self.hass)
+        device = device_registry.async_get_device(
+            identifiers={self._router_device_identifier})
+        if device is None:
+            return
+
+        self._save_snapshot()
+
+        device_info = self.router_device_info
+        device_registry.async_update_device(
+            device.id,
+            manufacturer=device_info["manufacturer"],
+            model=device_info["model"],
+            sw_version=device_info["sw_version"],
+            hw_version=device_info["hw_version"]
+        )
+
+
+    async def _start_syslog_listener(self) -> None:
+        try:
+            await self.syslog_listener.start()
+        except OSError as ex:
+            _LOGGER.error("%s: failed to listen for syslog on port %s, "
+                          "presence is polled: %s", self.config_entry.title,
+                          self.syslog_listener.port, ex)
+            self.syslog_listener = None
+            self.update_intervals[UPDATE_COORDINATOR_CLIENTS] = \
+                UPDATE_INTERVALS[UPDATE_COORDINATOR_CLIENTS]
+            self.scheduler.set_interval(
+                UPDATE_COORDINATOR_CLIENTS,
+                UPDATE_INTERVALS[UPDATE_COORDINATOR_CLIENTS])
+
+
+    @callback
+    def _syslog_presence_listener(self, client_id: str, active: bool) -> None:
+        """Update Network client presence from syslog message."""
+        coordinator = self.update_coordinators[UPDATE_COORDINATOR_CLIENTS]
+        if client_id not in self.client_store.clients:
+            # New client, its data is polled
+            if active:
+                self.config_entry.async_create_background_task(
+                    self.hass, coordinator.async_request_refresh(),
+                    f"{self.config_entry.title} new network client refresh"
+                )
+            return
+
+        if self.client_store.set_field(client_id, "active", active):
+            coordinator.async_update_listeners()
+
+
+    @callback
+    def _adapt_poll_intervals(self, latency: float) -> None:
+        """Adjust poll intervals after scheduled poll."""
+        stats = self.update_coordinators[UPDATE_COORDINATOR_SYS_STATS]
+        cpuload = stats.data.get("cpuload") \
+            if stats.last_update_success and stats.data else None
+
+        self.poll_controller.update(cpuload, latency, self._presence_changes)
+        self._presence_changes = 0
+
+        for topic, interval in self.poll_controller.intervals().items():
+            self.scheduler.set_interval(topic, interval)
 
-        # Update Network client device name
-        for client_id in data:
-            device = device_registry.async_get_device(
-                connections={(dr.CONNECTION_NETWORK_MAC, client_id)})
 
+    @callback
+    def _update_client_device_names(self, client_ids: list) -> None:
+        data = self.get_network_clients_data()
+        device_registry = dr.async_get(self.hass)
+
+        for client_id in client_ids:
+            if client_id not in data or client_id not in self._device_ids:
+                continue
+
+            device_id, device_name = self._device_ids[client_id]
             actual_device_name = self._make_client_device_name(client_id)
-            if device and device.name != actual_device_name:
+            if device_name != actual_device_name:
                 device_registry.async_update_device(
-                    device_id=device.id,
+                    device_id=device_id,
                     name=actual_device_name
                 )
 
 
+    @callback
+    def _load_device_ids(self) -> None:
+        """Index Network client devices by MAC."""
+        device_registry = dr.async_get(self.hass)
+        for device in dr.async_entries_for_config_entry(
+                device_registry, self.config_entry.entry_id):
+            self._index_device(device)
+
+
+    @callback
+    def _index_device(self, device: dr.DeviceEntry) -> None:
+        for connection_type, connection in device.connections:
+            if connection_type == dr.CONNECTION_NETWORK_MAC:
+                self._device_ids[connection] = (device.id, device.name)
+
+
+    @callback
+    def _device_registry_listener(
+            self,
+            event: Event[dr.EventDeviceRegistryUpdatedData]
+    ) -> None:
+        """Keep Network client devices index up to date."""
+        device_id = event.data["device_id"]
+
+        if event.data["action"] == "remove":
+            self._device_ids = {
+                client_id: device
+                for client_id, device in self._device_ids.items()
+                if device[0] != device_id
+            }
+            return
+
+        device = dr.async_get(self.hass).async_get(device_id)
+        if device and self.config_entry.entry_id in device.config_entries:
+            self._index_device(device)
+
+
     def get_network_clients_data(self) -> dict:
         """Get general Network clients data."""
         return self.update_coordinators[UPDATE_COORDINATOR_CLIENTS].data
 
 
+    async def _async_get_request_stats(self) -> dict:
+        return self.get_request_stats()
+
+
+    def get_request_stats(self) -> dict:
+        """Get requests statistics summary, times are in ms."""
+        endpoint_stats = self.api.endpoint_stats
+        batch_stats = endpoint_stats.get(RCI_BATCH_URL)
+        return {
+            "poll_latency": round(self.last_poll_latency * 1000, 1)
+                if self.last_poll_latency is not None else None,
+            "response_bytes": batch_stats.last_response_bytes
+                if batch_stats else None,
+            "decode_time": round(batch_stats.last_decode_time * 1000, 1)
+                if batch_stats else None,
+            "requests": sum(stats.requests for stats in endpoint_stats.values()),
+            "errors": sum(stats.errors for stats in endpoint_stats.values()),
+            "circuit_state": self._breaker.state,
+            "endpoints": {
+                url: stats.as_dict() for url, stats in endpoint_stats.items()
+            }
+        }
+
+
     def is_client_registered(self, client_id) -> bool:
         """Get Network client Registered field."""
         return self.get_network_clients_data()[client_id]["registered"]
@@ -301,13 +1192,14 @@ class KeeneticRouter:
     @property
     def router_device_info(self) -> dr.DeviceInfo:
         """Return Keenetic router DeviceInfo."""
-        fw_data = self.update_coordinators[UPDATE_COORDINATOR_SYS_FW].data
+        # Firmware info is loaded after setup
+        fw_data = self.update_coordinators[UPDATE_COORDINATOR_SYS_FW].data or {}
         return dr.DeviceInfo(
             identifiers={self._router_device_identifier},
-            manufacturer=fw_data["manufacturer"],
-            model=fw_data["model"],
-            sw_version=fw_data["title"],
-            hw_version=fw_data["hw_version"],
+            manufacturer=fw_data.get("manufacturer"),
+            model=fw_data.get("model"),
+            sw_version=fw_data.get("title"),
+            hw_version=fw_data.get("hw_version"),
             serial_number=self.config_entry.data["serial"],
             name=f"{self.config_entry.data[CONF_NAME]} Router"
         )
@@ -0,0 +1,390 @@
+"""Keenetic router poll scheduler."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+import datetime
+from functools import partial
+import logging
+import math
+import time
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+from homeassistant.helpers.event import async_call_at
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .api import RCICommand
+from .profiler import RefreshProfiler
+
+_LOGGER = logging.getLogger(__name__)
+
+# Topics due within the tolerance are polled together with the due ones
+POLL_TOLERANCE = 1.0
+
+# Topic result when its responses are the same as the previous ones
+UNCHANGED = object()
+
+
+@dataclass
+class PollTopic:
+    """Data polled from the router and published by its own coordinator."""
+    name: str
+    interval: datetime.timedelta
+    commands: Callable[[], list[RCICommand]]
+    process: Callable[[list], Any]
+    coordinator: DataUpdateCoordinator
+    next_poll: float = 0
+    # Skip processing and listeners when responses are unchanged
+    skip_unchanged: bool = True
+    # Processing gets (command, response) pairs of every fetch and handles
+    # failed commands itself
+    partial_results: bool = False
+    responses: list | None = None
+    unchanged_polls: int = 0
+
+
+class KeeneticPollScheduler:
+    """Router-level scheduler with a single timer for all coordinators.
+
+    The timer fires at the earliest next poll of the topics, due topics are
+    fetched with one RCI batch and results are fanned out to topics'
+    coordinators. Coordinators have no own timers, but still can be
+    refreshed on demand.
+    """
+
+    def __init__(  # noqa: D107
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        fetch: Callable[[list[RCICommand]], Awaitable[list]],
+        on_poll: Callable[[float], None] | None = None
+    ) -> None:
+        self.hass = hass
+        self.config_entry = config_entry
+        self.topics: dict[str, PollTopic] = {}
+        # Attached only while refresh cycles are profiled
+        self.profiler: RefreshProfiler | None = None
+
+        self._fetch = fetch
+        self._on_poll = on_poll
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        # Poll grid period, fleet phase and the loop time of the first
+        # phased grid instant, set on start
+        self._period = 0.0
+        self._phase = 0.0
+        self._anchor: float | None = None
+        self._poll_task: asyncio.Task | None = None
+
+
+    def add_topic(
+        self,
+        name: str,
+        interval: datetime.timedelta,
+        commands: Callable[[], list[RCICommand]],
+        process: Callable[[list], Any],
+        coordinator_class: type[DataUpdateCoordinator] = DataUpdateCoordinator,
+        skip_unchanged: bool = True,
+        partial_results: bool = False,
+        **coordinator_kwargs: Any
+    ) -> DataUpdateCoordinator:
+        """Add poll topic and return its update coordinator.
+
+        Topics processing results depending on time only must not skip
+        unchanged responses. Topics with partial results are processed even
+        if some of their commands failed, e.g. one of several interfaces.
+        """
+        coordinator = coordinator_class(
+            self.hass, _LOGGER,
+            name=name,
+            update_method=partial(self._async_update_topic, name),
+            **coordinator_kwargs
+        )
+        self.topics[name] = PollTopic(
+            name=name,
+            interval=interval,
+            commands=commands,
+            process=process,
+            coordinator=coordinator,
+            skip_unchanged=skip_unchanged,
+            partial_results=partial_results
+        )
+        return coordinator
+
+
+    async def async_first_refresh(self, names: list[str]) -> None:
+        """Fetch topics with one batch, fail setup on error."""
+        results = await self._async_fetch_topics(
+            [self.topics[name] for name in names]
+        )
+
+        now = self.hass.loop.time()
+        for name, data in results.items():
+            topic = self.topics[name]
+            if isinstance(data, ConfigEntryAuthFailed):
+                raise data
+            if isinstance(data, Exception):
+                raise ConfigEntryNotReady(str(data)) from data
+            topic.next_poll = self._next_poll_time(topic, now)
+            if data is not UNCHANGED:
+                topic.coordinator.async_set_updated_data(data)
+
+
+    def start(self, phase: float = 0) -> None:
+        """Start polling on schedule.
+
+        Polls of every topic are placed on a grid of GCD of topics
+        intervals, at the phase fraction of the topic interval, so routers
+        of the fleet do not poll at the same moments while topics of one
+        router are polled together. Topics not polled yet are polled at
+        the first grid instant after the phase delay.
+        """
+        self._period = float(math.gcd(*(
+            int(topic.interval.total_seconds())
+            for topic in self.topics.values()
+        )))
+        now = self.hass.loop.time()
+        self._phase = phase
+        self._anchor = now + self._period * phase
+
+        for topic in self.topics.values():
+            topic.next_poll = self._next_poll_time(topic, now) \
+                if topic.next_poll > now else self._anchor + self._period
+        self._schedule()
+
+
+    @callback
+    def _schedule(self) -> None:
+        """Set the timer to the earliest next poll.
+
+        While a poll is running the timer is set when it ends.
+        """
+        if self._anchor is None or self._poll_task:
+            return
+
+        if self._unsub_timer:
+            self._unsub_timer()
+        self._unsub_timer = async_call_at(
+            self.hass, self._async_tick,
+            min(topic.next_poll for topic in self.topics.values())
+        )
+
+
+    def set_interval(self, name: str, interval: datetime.timedelta) -> None:
+        """Change topic poll interval, next poll is moved accordingly."""
+        topic = self.topics[name]
+        if interval == topic.interval:
+            return
+
+        topic.next_poll += (interval - topic.interval).total_seconds()
+        topic.interval = interval
+        self._schedule()
+
+
+    def postpone(self, names: list[str]) -> None:
+        """Poll topics only after their full interval from now."""
+        now = self.hass.loop.time()
+        for name in names:
+            topic = self.topics[name]
+            topic.next_poll = self._next_poll_time(topic, now)
+        self._schedule()
+
+
+    def phase_delay(self) -> float:
+        """Seconds until the first phased grid instant of the router."""
+        if self._anchor is None:
+            return 0
+        return max(0, self._anchor - self.hass.loop.time())
+
+
+    def _next_poll_time(self, topic: PollTopic, now: float) -> float:
+        """Next poll time of the topic after a poll at now.
+
+        Once started, polls are placed on the topic grid: grid instants at
+        the phase fraction of the topic interval. The next poll is at least
+        half of the interval after now.
+        """
+        interval = topic.interval.total_seconds()
+        if self._anchor is None:
+            return now + interval
+
+        period = self._period
+        offset = self._anchor + \
+            math.floor(self._phase * interval / period) * period
+        earliest = now + interval / 2
+        return earliest + (offset - earliest) % interval
+
+
+    def stop(self) -> None:
+        """Stop polling on schedule."""
+        self._anchor = None
+        if self._unsub_timer:
+            self._unsub_timer()
+            self._unsub_timer = None
+        if self._poll_task:
+            self._poll_task.cancel()
+        if self.profiler:
+            self.profiler.cancel()
+            self.profiler = None
+
+
+    async def _async_tick(self, _now: datetime.datetime) -> None:
+        self._unsub_timer = None
+        if self._poll_task and not self._poll_task.done():
+            # Refresh on demand, the timer is set when it ends
+            return
+
+        now = self.hass.loop.time()
+        due = [
+            topic for topic in self.topics.values()
+            if topic.next_poll <= now + POLL_TOLERANCE
+        ]
+        if due:
+            await self._async_poll(due)
+        else:
+            self._schedule()
+
+
+    async def async_refresh(self, names: list[str]) -> None:
+        """Poll topics now with one batch, errors go to their coordinators."""
+        if self._poll_task and not self._poll_task.done():
+            _LOGGER.debug("%s: previous poll is still running",
+                          self.config_entry.title)
+            return
+
+        await self._async_poll([self.topics[name] for name in names])
+
+
+    async def _async_poll(self, topics: list[PollTopic]) -> None:
+        """Fetch topics and fan out results to their coordinators."""
+        now = self.hass.loop.time()
+        for topic in topics:
+            topic.next_poll = self._next_poll_time(topic, now)
+
+        profiler = self.profiler
+        if profiler:
+            profiler.start_cycle()
+
+        self._poll_task = asyncio.current_task()
+        try:
+            results = await self._async_fetch_topics(topics)
+            latency = self.hass.loop.time() - now
+
+            started = time.perf_counter() if profiler else 0
+            for name, data in results.items():
+                topic = self.topics[name]
+                if isinstance(data, ConfigEntryAuthFailed):
+                    self.config_entry.async_start_reauth(self.hass)
+                if isinstance(data, Exception):
+                    topic.coordinator.async_set_update_error(data)
+                elif data is not UNCHANGED:
+                    topic.coordinator.async_set_updated_data(data)
+
+            if self._on_poll:
+                self._on_poll(latency)
+            if profiler:
+                profiler.add("dispatch", time.perf_counter() - started)
+        finally:
+            self._poll_task = None
+            self._schedule()
+            if profiler:
+                profiler.end_cycle()
+                if profiler.done and self.profiler is profiler:
+                    self.profiler = None
+
+
+    async def _async_fetch_topics(
+            self,
+            topics: list[PollTopic]
+    ) -> dict[str, Any]:
+        """Fetch topics with one batch.
+
+        Returns processed data, an exception or UNCHANGED for every topic
+        name.
+        """
+        topic_commands = {topic.name: topic.commands() for topic in topics}
+        commands = [
+            command
+            for commands in topic_commands.values()
+            for command in commands
+        ]
+
+        profiler = self.profiler
+        started = time.perf_counter() if profiler else 0
+        try:
+            responses = await self._fetch(commands)
+        except (UpdateFailed, ConfigEntryAuthFailed) as ex:
+            return {topic.name: ex for topic in topics}
+        except Exception as ex:  # noqa: BLE001
+            _LOGGER.debug("%s: unexpected fetch error", self.config_entry.title,
+                          exc_info=True)
+            error = UpdateFailed(f"Failed to fetch data: {ex!r}")
+            return {topic.name: error for topic in topics}
+        finally:
+            if profiler:
+                profiler.add("fetch", time.perf_counter() - started)
+
+        started = time.perf_counter() if profiler else 0
+        results = {}
+        for topic in topics:
+            count = len(topic_commands[topic.name])
+            topic_responses, responses = responses[:count], responses[count:]
+            if self._is_unchanged(topic, topic_responses):
+                topic.unchanged_polls += 1
+                results[topic.name] = UNCHANGED
+                continue
+
+            if topic.skip_unchanged:
+                topic.responses = topic_responses
+            results[topic.name] = self._process_topic(
+                topic, topic_commands[topic.name], topic_responses)
+
+        if profiler:
+            profiler.add("process", time.perf_counter() - started)
+        return results
+
+
+    async def _async_update_topic(self, name: str) -> Any:
+        """Fetch single topic on coordinator refresh request."""
+        topic = self.topics[name]
+        data = (await self._async_fetch_topics([topic]))[name]
+        if isinstance(data, Exception):
+            raise data
+        if data is UNCHANGED:
+            return topic.coordinator.data
+        return data
+
+
+    @staticmethod
+    def _is_unchanged(topic: PollTopic, responses: list) -> bool:
+        """Whether responses are equal to successfully processed ones."""
+        return topic.skip_unchanged and \
+            topic.coordinator.last_update_success and \
+            topic.coordinator.data is not None and \
+            topic.responses == responses
+
+
+    @staticmethod
+    def _process_topic(
+            topic: PollTopic,
+            commands: list[RCICommand],
+            responses: list
+    ) -> Any:
+        if topic.partial_results:
+            # Commands of this fetch, topic commands may differ next time
+            data = list(zip(commands, responses, strict=True))
+        else:
+            for response in responses:
+                if isinstance(response, Exception):
+                    return UpdateFailed(
+                        f"Failed to fetch {topic.name}: {response}")
+            data = responses
+
+        try:
+            return topic.process(data)
+        except UpdateFailed as ex:
+            return ex
+        except (KeyError, TypeError, ValueError, ZeroDivisionError) as ex:
+            return UpdateFailed(f"Unexpected {topic.name} data: {ex}")
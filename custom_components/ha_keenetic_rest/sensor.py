@@ -10,28 +10,47 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import PERCENTAGE, UnitOfDataRate, UnitOfTime
+from homeassistant.const import (
+    PERCENTAGE,
+    EntityCategory,
+    UnitOfDataRate,
+    UnitOfInformation,
+    UnitOfTime,
+)
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
+    CONF_CLIENT_SPEED_SENSORS,
+    CONF_SPEED_STATISTICS,
+    CONF_TOP_TALKERS,
+    DEFAULT_TOP_TALKERS,
     DOMAIN,
     SIGNAL_NEW_NETWORK_CLIENTS,
-    UPDATE_COORDINATOR_CLIENTS_RX_SPEED,
-    UPDATE_COORDINATOR_CLIENTS_TX_SPEED,
+    UPDATE_COORDINATOR_CLIENTS,
+    UPDATE_COORDINATOR_DIAGNOSTICS,
     UPDATE_COORDINATOR_IF_STATS,
     UPDATE_COORDINATOR_SYS_STATS,
     BaseKeeneticEntityDescription,
 )
 from .entity import (
+    INTERFACE_KEY_PREFIX,
+    BaseKeeneticInterfaceEntity,
     BaseKeeneticNetworkClientEntity,
     BaseKeeneticRouterEntity,
     add_network_client_entities,
+    interface_entity_key,
+    remove_stale_router_entities,
 )
 from .router import KeeneticRouter
 
 
+# Entity description key prefix of top talker sensors
+TOP_TALKER_KEY_PREFIX = "top_"
+
+
 class GeneralRouterSensor(BaseKeeneticRouterEntity, SensorEntity):
     """Router sensor."""
 
@@ -45,13 +64,59 @@ class RouterWANSpeedSensor(GeneralRouterSensor):
         return {}
 
 
+class InterfaceSpeedSensor(BaseKeeneticInterfaceEntity, SensorEntity):
+    """Selected interface speed sensor."""
+    entity_description: "InterfaceSensorDescription"
+
+    @property
+    def native_value(self) -> int | None:  # noqa: D102
+        return self._get_coordinator_data().get(
+            self.entity_description.value_key)
+
+
 class NetworkClientSpeedSensor(BaseKeeneticNetworkClientEntity, SensorEntity):
     """Network client sensor."""
-    def _get_attributes_data(self) -> dict:
-        if data := self.router.get_network_clients_data():
-            return data.get(self.client_id, {})
+    @property
+    def native_value(self) -> int | None:  # noqa: D102
+        return self.router.client_rates.get_rate(
+            self.client_id, self.entity_description.key)
+
+    @property
+    def extra_state_attributes(self) -> dict:  # noqa: D102
+        attributes = super().extra_state_attributes
+        if self.router.config_entry.options.get(CONF_SPEED_STATISTICS):
+            history = self.router.client_history
+            key = self.entity_description.key
+            for attr_name, value in (
+                ("Mean", history.mean(self.client_id, key)),
+                ("Peak", history.peak(self.client_id, key)),
+                ("95th percentile",
+                 history.percentile(self.client_id, key, 95))
+            ):
+                attributes[attr_name] = round(value) \
+                    if value is not None else None
+        return attributes
+
+
+class TopTalkerSensor(GeneralRouterSensor):
+    """Network client with the highest rate of the given rank."""
+    entity_description: "TopTalkerSensorDescription"
+
+    def _get_top_talker(self) -> dict:
+        talkers = self.router.top_talkers.get(self.entity_description.rate_key, [])
+        if self.entity_description.rank <= len(talkers):
+            return talkers[self.entity_description.rank - 1]
         return {}
 
+    @property
+    def native_value(self) -> int | None:  # noqa: D102
+        return self._get_top_talker().get("rate")
+
+    @property
+    def extra_state_attributes(self) -> dict:  # noqa: D102
+        talker = self._get_top_talker()
+        return {"MAC": talker.get("mac"), "Name": talker.get("name")}
+
 
 @dataclass
 class RouterSensorDescription(
@@ -60,6 +125,20 @@ class RouterSensorDescription(
     entity_class = GeneralRouterSensor
 
 
+@dataclass
+class TopTalkerSensorDescription(RouterSensorDescription):
+    """Top talker sensor description."""
+    rate_key: str = None
+    rank: int = 1
+
+
+@dataclass
+class InterfaceSensorDescription(RouterSensorDescription):
+    """Selected interface sensor description."""
+    interface: str = None
+    value_key: str = None
+
+
 @dataclass
 class NetworkClientSensorDescription(
     BaseKeeneticEntityDescription, SensorEntityDescription):
@@ -115,6 +194,50 @@ ROUTER_SENSORS: tuple[RouterSensorDescription, ...] = (
         suggested_display_precision=0,
         update_coordinator=UPDATE_COORDINATOR_IF_STATS,
         entity_class=RouterWANSpeedSensor
+    ),
+    RouterSensorDescription(
+        key="poll_latency",
+        translation_key="poll_latency",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=0,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        update_coordinator=UPDATE_COORDINATOR_DIAGNOSTICS
+    ),
+    RouterSensorDescription(
+        key="response_bytes",
+        translation_key="response_size",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        suggested_unit_of_measurement=UnitOfInformation.KILOBYTES,
+        suggested_display_precision=1,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        update_coordinator=UPDATE_COORDINATOR_DIAGNOSTICS
+    ),
+    RouterSensorDescription(
+        key="decode_time",
+        translation_key="decode_time",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=1,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        update_coordinator=UPDATE_COORDINATOR_DIAGNOSTICS
+    ),
+    RouterSensorDescription(
+        key="errors",
+        translation_key="request_errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        update_coordinator=UPDATE_COORDINATOR_DIAGNOSTICS,
+        extra_attributes={"Requests": "requests",
+                          "Circuit state": "circuit_state"}
     )
 )
 
@@ -127,7 +250,7 @@ NETWORK_CLIENT_SENSORS: tuple[NetworkClientSensorDescription, ...] = (
         native_unit_of_measurement=UnitOfDataRate.BITS_PER_SECOND,
         suggested_unit_of_measurement=UnitOfDataRate.KILOBITS_PER_SECOND,
         suggested_display_precision=0,
-        update_coordinator=UPDATE_COORDINATOR_CLIENTS_RX_SPEED,
+        update_coordinator=UPDATE_COORDINATOR_CLIENTS,
         extra_attributes = {"Interface ID": {"interface": "id"},
                             "Interface name": {"interface": "name"}},
         entity_class=NetworkClientSpeedSensor
@@ -140,7 +263,7 @@ NETWORK_CLIENT_SENSORS: tuple[NetworkClientSensorDescription, ...] = (
         native_unit_of_measurement=UnitOfDataRate.BITS_PER_SECOND,
         suggested_unit_of_measurement=UnitOfDataRate.KILOBITS_PER_SECOND,
         suggested_display_precision=0,
-        update_coordinator=UPDATE_COORDINATOR_CLIENTS_TX_SPEED,
+        update_coordinator=UPDATE_COORDINATOR_CLIENTS,
         extra_attributes = {"Interface ID": {"interface": "id"},
                             "Interface name": {"interface": "name"}},
         entity_class=NetworkClientSpeedSensor
@@ -148,6 +271,74 @@ NETWORK_CLIENT_SENSORS: tuple[NetworkClientSensorDescription, ...] = (
 )
 
 
+def make_top_talker_sensors(count: int) -> list[TopTalkerSensorDescription]:
+    """Make top talker sensors descriptions for ranks up to count."""
+    return [
+        TopTalkerSensorDescription(
+            key=f"{TOP_TALKER_KEY_PREFIX}{rate_key}_{rank}",
+            translation_key=translation_key,
+            translation_placeholders={"rank": str(rank)},
+            device_class=SensorDeviceClass.DATA_RATE,
+            state_class=SensorStateClass.MEASUREMENT,
+            native_unit_of_measurement=UnitOfDataRate.BITS_PER_SECOND,
+            suggested_unit_of_measurement=UnitOfDataRate.KILOBITS_PER_SECOND,
+            suggested_display_precision=0,
+            update_coordinator=UPDATE_COORDINATOR_CLIENTS,
+            entity_class=TopTalkerSensor,
+            rate_key=rate_key,
+            rank=rank
+        )
+        for rate_key, translation_key in (("rxspeed", "top_rx"),
+                                          ("txspeed", "top_tx"))
+        for rank in range(1, count + 1)
+    ]
+
+
+def make_interface_sensors(
+    interfaces: list[str]
+) -> list[InterfaceSensorDescription]:
+    """Make RX and TX speed sensors descriptions of the interfaces."""
+    return [
+        InterfaceSensorDescription(
+            key=interface_entity_key(interface, rate_key),
+            translation_key=translation_key,
+            translation_placeholders={"interface": interface},
+            device_class=SensorDeviceClass.DATA_RATE,
+            state_class=SensorStateClass.MEASUREMENT,
+            native_unit_of_measurement=UnitOfDataRate.BITS_PER_SECOND,
+            suggested_unit_of_measurement=UnitOfDataRate.KILOBITS_PER_SECOND,
+            suggested_display_precision=0,
+            update_coordinator=UPDATE_COORDINATOR_IF_STATS,
+            entity_class=InterfaceSpeedSensor,
+            interface=interface,
+            value_key=rate_key
+        )
+        for interface in interfaces
+        for rate_key, translation_key in (("rxspeed", "interface_rx_speed"),
+                                          ("txspeed", "interface_tx_speed"))
+    ]
+
+
+@callback
+def _remove_client_speed_sensors(hass: HomeAssistant,
+                                 router: KeeneticRouter) -> None:
+    """Remove registered Network clients speed sensors."""
+    entity_registry = er.async_get(hass)
+    router_unique_ids = {
+        f"{router.unique_id}-{description.key}".lower()
+        for description in ROUTER_SENSORS
+    }
+    client_suffixes = tuple(
+        f"-{description.key}" for description in NETWORK_CLIENT_SENSORS)
+
+    for entry in er.async_entries_for_config_entry(
+            entity_registry, router.config_entry.entry_id):
+        if entry.domain == "sensor" and \
+                entry.unique_id.endswith(client_suffixes) and \
+                entry.unique_id not in router_unique_ids:
+            entity_registry.async_remove(entry.entity_id)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -157,13 +348,27 @@ async def async_setup_entry(
     router: KeeneticRouter = hass.data[DOMAIN][config_entry.entry_id]
 
     # Add Router sensors
+    top_talkers = config_entry.options.get(CONF_TOP_TALKERS, DEFAULT_TOP_TALKERS)
+    top_talker_sensors = make_top_talker_sensors(top_talkers)
+    remove_stale_router_entities(hass, router, "sensor", TOP_TALKER_KEY_PREFIX,
+                                 top_talker_sensors)
+    interface_sensors = make_interface_sensors(router.selected_interfaces)
+    remove_stale_router_entities(hass, router, "sensor", INTERFACE_KEY_PREFIX,
+                                 interface_sensors)
     router_sensors = [
         description.entity_class(
             router, description
-        ) for description in ROUTER_SENSORS
+        ) for description in (*ROUTER_SENSORS,
+                              *top_talker_sensors,
+                              *interface_sensors)
     ]
     async_add_entities(router_sensors)
 
+    # Per-client speed sensors may be replaced with top talkers
+    if not config_entry.options.get(CONF_CLIENT_SPEED_SENSORS, True):
+        _remove_client_speed_sensors(hass, router)
+        return
+
     # Add current Network clients sensors
     add_network_client_entities(router, router.tracked_network_client_ids,
                                NETWORK_CLIENT_SENSORS, async_add_entities)
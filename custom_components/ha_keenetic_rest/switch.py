@@ -25,6 +25,7 @@ from .router import KeeneticRouter
 class NetworkClientRegisteredSwitch(
     BaseKeeneticNetworkClientEntity, SwitchEntity):
     """Network client Registered switch."""
+    _client_fields = ("mac",)
 
     @property
     def is_on(self) -> bool | None:  # noqa: D102
@@ -36,18 +37,17 @@ class NetworkClientRegisteredSwitch(
         if mac and name:
             await self.router.change_client_registered_setting(
                 register=True, mac=mac, name=name)
-        await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs):  # noqa: D102
         if mac := self._get_coordinator_data().get("mac"):
             await self.router.change_client_registered_setting(
                 register=False, mac=mac)
-        await self.coordinator.async_request_refresh()
 
 
 class NetworkClientInternetAccessSwitch(
     BaseKeeneticNetworkClientEntity, SwitchEntity):
     """Network client Internet access switch."""
+    _client_fields = ("mac", "registered")
 
     @property
     def is_on(self) -> bool | None:  # noqa: D102
@@ -60,13 +60,11 @@ class NetworkClientInternetAccessSwitch(
         if mac := self._get_coordinator_data().get("mac"):
             await self.router.change_client_internet_access_setting(
                 permit=True, mac=mac)
-        await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs):  # noqa: D102
         if mac := self._get_coordinator_data().get("mac"):
             await self.router.change_client_internet_access_setting(
                 permit=False, mac=mac)
-        await self.coordinator.async_request_refresh()
 
     @property
     def available(self) -> bool:  # noqa: D102
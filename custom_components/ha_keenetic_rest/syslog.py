@@ -0,0 +1,99 @@
+"""Network clients presence from router syslog messages."""
+
+import asyncio
+from collections.abc import Callable
+import logging
+import re
+
+_LOGGER = logging.getLogger(__name__)
+
+_MAC = r"(?P<mac>[0-9a-f]{2}(?::[0-9a-f]{2}){5})"
+
+# Message pattern -> client presence
+PRESENCE_PATTERNS = (
+    # wmond: WifiMaster0/AccessPoint0: STA(aa:bb:cc:dd:ee:ff) had associated.
+    (re.compile(rf"STA\({_MAC}\) had (?:re)?associated", re.IGNORECASE), True),
+    # wmond: ... STA(aa:bb:cc:dd:ee:ff) had deauthenticated by STA (reason: ...)
+    (re.compile(rf"STA\({_MAC}\) (?:had )?(?:deauthenticated|disassociated|"
+                r"been kicked)", re.IGNORECASE), False),
+    # ndhcps: DHCPACK of 192.168.1.33 to aa:bb:cc:dd:ee:ff.
+    (re.compile(rf"DHCPACK of \S+ to {_MAC}", re.IGNORECASE), True),
+    # ndhcps: DHCPRELEASE of 192.168.1.33 from aa:bb:cc:dd:ee:ff.
+    (re.compile(rf"DHCPRELEASE of \S+ from {_MAC}", re.IGNORECASE), False),
+)
+
+# Syslog priority prefix: <30>
+_PRIORITY = re.compile(r"^<\d{1,3}>")
+
+
+def parse_presence(message: str) -> tuple[str, bool] | None:
+    """Get (client MAC, active) from syslog message."""
+    message = _PRIORITY.sub("", message.strip())
+    for pattern, active in PRESENCE_PATTERNS:
+        if match := pattern.search(message):
+            return match.group("mac").lower(), active
+    return None
+
+
+class SyslogProtocol(asyncio.DatagramProtocol):
+    """UDP syslog receiver passing presence events to the callback."""
+
+    def __init__(  # noqa: D107
+        self,
+        on_presence: Callable[[str, bool], None],
+        allowed_addresses: set[str] | None = None
+    ) -> None:
+        self._on_presence = on_presence
+        self._allowed_addresses = allowed_addresses
+
+
+    def datagram_received(self, data: bytes, addr: tuple) -> None:
+        """Parse received syslog message."""
+        if self._allowed_addresses and addr[0] not in self._allowed_addresses:
+            return
+
+        for line in data.decode("utf-8", errors="replace").splitlines():
+            if presence := parse_presence(line):
+                self._on_presence(*presence)
+
+
+class KeeneticSyslogListener:
+    """Listen for router syslog messages on a local UDP port.
+
+    Only messages sent from the router addresses are accepted.
+    """
+
+    def __init__(  # noqa: D107
+        self,
+        router_host: str,
+        port: int,
+        on_presence: Callable[[str, bool], None],
+        host: str = "0.0.0.0"  # noqa: S104
+    ) -> None:
+        self.router_host = router_host
+        self.port = port
+        self.host = host
+        self._on_presence = on_presence
+        self._transport: asyncio.DatagramTransport | None = None
+
+
+    async def start(self) -> None:
+        """Resolve the router host and start listening."""
+        loop = asyncio.get_running_loop()
+        addresses = {
+            info[4][0] for info in await loop.getaddrinfo(
+                self.router_host, None, type=0)
+        }
+        self._transport, _ = await loop.create_datagram_endpoint(
+            lambda: SyslogProtocol(self._on_presence, addresses),
+            local_addr=(self.host, self.port)
+        )
+        _LOGGER.debug("Listening for %s syslog on %s:%s",
+                      self.router_host, self.host, self.port)
+
+
+    def stop(self) -> None:
+        """Stop listening."""
+        if self._transport:
+            self._transport.close()
+            self._transport = None
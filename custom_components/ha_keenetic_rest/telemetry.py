@@ -0,0 +1,118 @@
+"""Network clients speed history."""
+
+from array import array
+import math
+
+from .rates import RATE_COUNTERS
+
+# Samples kept per client and rate. Statistics cover the last polls, not a
+# fixed time: the poll interval changes with adaptive polling and syslog
+HISTORY_SIZE = 120
+
+
+class ClientSpeedHistory:
+    """Clients rates history in fixed-size ring buffers.
+
+    Every client gets a slot. Samples of one rate of all clients are kept
+    in a single array of slots * size doubles, every slot row is a ring
+    buffer. Memory per client is constant, slots of removed clients are
+    reused. Missing rates are stored as NaN and skipped by computations.
+    """
+
+    def __init__(  # noqa: D107
+        self,
+        keys: tuple[str, ...] = tuple(RATE_COUNTERS),
+        size: int = HISTORY_SIZE
+    ) -> None:
+        self.keys = keys
+        self.size = size
+
+        self._slots: dict[str, int] = {}
+        self._free_slots: list[int] = []
+        self._columns = {key: array("d") for key in keys}
+        # Next write position and samples count of every slot
+        self._positions = array("L")
+        self._counts = array("L")
+
+
+    def record(self, rates: dict[str, dict[str, int | None]]) -> None:
+        """Add a sample of every client, forget clients missing in rates."""
+        for client_id in self._slots.keys() - rates.keys():
+            self._free_slots.append(self._slots.pop(client_id))
+
+        for client_id, client_rates in rates.items():
+            slot = self._slots.get(client_id)
+            if slot is None:
+                slot = self._slots[client_id] = self._allocate()
+
+            position = self._positions[slot]
+            offset = slot * self.size + position
+            for key, column in self._columns.items():
+                value = client_rates.get(key)
+                column[offset] = math.nan if value is None else value
+
+            self._positions[slot] = (position + 1) % self.size
+            self._counts[slot] = min(self._counts[slot] + 1, self.size)
+
+
+    def samples(
+            self,
+            client_id: str,
+            key: str,
+            window: int | None = None
+    ) -> list[float]:
+        """Get the last window samples of the client rate, oldest first."""
+        slot = self._slots.get(client_id)
+        if slot is None:
+            return []
+
+        count = self._counts[slot]
+        window = min(window or count, count)
+        row = self._columns[key][slot * self.size:(slot + 1) * self.size]
+        end = self._positions[slot]
+        start = end - window
+        values = row[start:end] if start >= 0 else row[start:] + row[:end]
+        return [value for value in values if not math.isnan(value)]
+
+
+    def mean(self, client_id: str, key: str,
+             window: int | None = None) -> float | None:
+        """Rolling mean of the client rate."""
+        if values := self.samples(client_id, key, window):
+            return math.fsum(values) / len(values)
+        return None
+
+
+    def peak(self, client_id: str, key: str,
+             window: int | None = None) -> float | None:
+        """Peak of the client rate."""
+        if values := self.samples(client_id, key, window):
+            return max(values)
+        return None
+
+
+    def percentile(self, client_id: str, key: str, percent: float,
+                   window: int | None = None) -> float | None:
+        """Percentile of the client rate with linear interpolation."""
+        if not (values := sorted(self.samples(client_id, key, window))):
+            return None
+
+        rank = (len(values) - 1) * percent / 100
+        lower = math.floor(rank)
+        upper = min(lower + 1, len(values) - 1)
+        return values[lower] + (values[upper] - values[lower]) * (rank - lower)
+
+
+    def _allocate(self) -> int:
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._positions[slot] = 0
+            self._counts[slot] = 0
+            return slot
+
+        empty_row = array("d", [math.nan]) * self.size
+        for column in self._columns.values():
+            column.extend(empty_row)
+        self._positions.append(0)
+        self._counts.append(0)
+        return len(self._positions) - 1
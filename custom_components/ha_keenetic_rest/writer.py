@@ -0,0 +1,113 @@
+"""Batched router settings writes."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+import logging
+from typing import Any
+
+from .api import RCICommand
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RCIWriteQueue:
+    """Collect RCI write commands and send them as one batch request.
+
+    Commands queued within the write window share a single POST "rci/"
+    request. A command replaces the pending one with the same key, e.g.
+    the previous toggle of the same client setting, and its callers get
+    the result of the replacing command. Batches are sent one at a time
+    in the queued order, so a later change can not overtake an earlier
+    one which is retried. The on_sent callback is called once after every
+    batch, whether it succeeded or not.
+    """
+
+    def __init__(  # noqa: D107
+        self,
+        send: Callable[[list[RCICommand]], Awaitable[list]],
+        on_sent: Callable[[], None],
+        window: float
+    ) -> None:
+        self._send_commands = send
+        self._on_sent = on_sent
+        self._window = window
+        # Key -> (command, waiting callers futures)
+        self._pending: dict[Hashable, tuple[RCICommand, list[asyncio.Future]]] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+        # Waiters acquire the lock in the order of batches
+        self._send_lock = asyncio.Lock()
+
+
+    async def write(self, key: Hashable, command: RCICommand) -> Any:
+        """Queue command and wait for its result.
+
+        Raises KeeneticRCIError if the command failed.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        futures = self._pending[key][1] if key in self._pending else []
+        futures.append(future)
+        self._pending[key] = (command, futures)
+
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._window, self._flush)
+
+        return await future
+
+
+    def cancel(self) -> None:
+        """Cancel pending and in-flight writes, their callers get CancelledError."""
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        for _, futures in self._pending.values():
+            for future in futures:
+                future.cancel()
+        self._pending = {}
+
+        for task in self._tasks:
+            task.cancel()
+
+
+    def _flush(self) -> None:
+        self._flush_handle = None
+        pending, self._pending = list(self._pending.values()), {}
+
+        task = asyncio.get_running_loop().create_task(self._send(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+    async def _send(
+            self,
+            pending: list[tuple[RCICommand, list[asyncio.Future]]]
+    ) -> None:
+        try:
+            async with self._send_lock:
+                _LOGGER.debug("Sending %d write commands", len(pending))
+                try:
+                    results = await self._send_commands(
+                        [command for command, _ in pending]
+                    )
+                except Exception as ex:  # noqa: BLE001
+                    results = [ex] * len(pending)
+                self._on_sent()
+
+            for (_, futures), result in zip(pending, results, strict=True):
+                for future in futures:
+                    if future.done():
+                        # Caller was cancelled
+                        continue
+                    if isinstance(result, Exception):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+        finally:
+            # Cancelled while waiting for the previous batch or sending,
+            # callers must not wait forever
+            for _, futures in pending:
+                for future in futures:
+                    if not future.done():
+                        future.cancel()